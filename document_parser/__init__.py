@@ -11,22 +11,14 @@ __author__ = "Document Parser Team"
 __email__ = "support@documentparser.com"
 
 
-# Delayed import to avoid circular dependency issues
-def get_document_parser():
-    """Get DocumentParser class with delayed import."""
-    from .core.parser import DocumentParser
+def __getattr__(name: str):
+    """Import DocumentParser on first access to avoid circular imports."""
+    if name == "DocumentParser":
+        from .core.parser import DocumentParser
 
-    return DocumentParser
-
-
-# Create a class proxy for better import experience
-class DocumentParser:
-    """Proxy class for DocumentParser with delayed import."""
-
-    def __new__(cls, *args, **kwargs):
-        from .core.parser import DocumentParser as ActualDocumentParser
-
-        return ActualDocumentParser(*args, **kwargs)
+        globals()["DocumentParser"] = DocumentParser
+        return DocumentParser
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -34,5 +26,4 @@ __all__ = [
     "DocumentResult",
     "PageContent",
     "DocumentInfo",
-    "get_document_parser",
 ]
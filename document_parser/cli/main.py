@@ -3,14 +3,25 @@ Command-line interface for the document parser.
 """
 
 import click
+import json
 import os
 import sys
 from pathlib import Path
 
 from ..core.parser import DocumentParser
+from ..utils.cache import get_or_parse
 from ..utils.exceptions import DocumentParsingError
 from ..utils.logging import setup_logger, logger
-from ..utils.templates import TEMPLATE_EXAMPLES
+from ..utils.templates import (
+    TEMPLATE_EXAMPLES,
+    COMPILED_TEMPLATE_EXAMPLES,
+    STRUCTURED_TEMPLATE_EXAMPLES,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
 
 @click.group()
@@ -49,6 +60,9 @@ def parse(files: tuple, output: str, output_dir: str, pretty: bool) -> None:
             )
             sys.exit(1)
 
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
         # Process files
         for file_path in file_list:
             try:
@@ -66,7 +80,6 @@ def parse(files: tuple, output: str, output_dir: str, pretty: bool) -> None:
                 if output:
                     output_path = output
                 elif output_dir:
-                    os.makedirs(output_dir, exist_ok=True)
                     base_name = Path(file_path).stem
                     output_path = os.path.join(output_dir, f"{base_name}.json")
                 else:
@@ -121,6 +134,15 @@ def info() -> None:
 @click.option(
     "--template-dir", type=click.Path(), help="Directory containing template files"
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help=(
+        "Re-parse without reading or writing the parse cache. Caching is on "
+        "by default and stores parse results under $XDG_CACHE_HOME (or "
+        "~/.cache)/document_parser"
+    ),
+)
 def render(
     file_path: str,
     template: str,
@@ -128,6 +150,7 @@ def render(
     template_example: str,
     output: str,
     template_dir: str,
+    no_cache: bool,
 ) -> None:
     """
     Parse a document and render it with a Jinja2 template.
@@ -142,20 +165,40 @@ def render(
 
         parser = DocumentParser(config)
 
+        # Repeat renders of an unchanged file reuse the cached parse result
+        def load_document():
+            if no_cache:
+                return parser.parse_file(file_path)
+            return get_or_parse(parser, file_path)
+
         # Determine which template to use
         template_string = None
         if template:
             template_string = template
         elif template_example:
-            template_string = TEMPLATE_EXAMPLES.get(template_example)
-            if not template_string:
+            if template_example not in COMPILED_TEMPLATE_EXAMPLES:
                 click.echo(
                     f"Error: Template example '{template_example}' not found", err=True
                 )
                 return
+            # Examples are precompiled at import, so only render here
+            result = load_document()
+            processor = parser.get_template_processor()
+            if template_example in STRUCTURED_TEMPLATE_EXAMPLES:
+                # Structured examples are decoded and re-serialised once,
+                # giving consistently indented JSON
+                data = processor.render_example_data(template_example, result)
+                if orjson is not None:
+                    rendered = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode(
+                        "utf-8"
+                    )
+                else:
+                    rendered = json.dumps(data, indent=2, ensure_ascii=False)
+            else:
+                rendered = processor.render_example(template_example, result)
         elif template_file:
             # Parse document first, then render from file
-            result = parser.parse_file(file_path)
+            result = load_document()
             rendered = parser.render_template_file(
                 os.path.basename(template_file), result
             )
@@ -166,9 +209,9 @@ def render(
             )
             return
 
-        # Render template (if not already rendered from file)
+        # Render template string (if not already rendered above)
         if template_string:
-            result = parser.parse_file(file_path)
+            result = load_document()
             rendered = parser.render_template(template_string, result)
 
         # Output result
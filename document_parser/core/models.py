@@ -2,42 +2,87 @@
 Data models for document parsing results.
 """
 
+import os
+import sys
 from datetime import datetime
 from typing import List, Dict, Any
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
+# Flags for writing result files through a raw OS file descriptor
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(filepath: str, data: bytes) -> None:
+    """
+    Write bytes to a file without Python's buffered I/O layers.
+
+    Args:
+        filepath: Path of the file to create or truncate
+        data: Encoded file contents
+    """
+    fd = os.open(filepath, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+# Instances are created per heading, cell and page, so drop the per-instance
+# __dict__ where the running Python supports slotted dataclasses (3.10+)
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class HeadingInfo:
     """Information about a heading in the document."""
 
     level: int
     text: str
 
+    def __post_init__(self) -> None:
+        # Heading text repeats across pages and sheets; share one copy
+        if type(self.text) is str:
+            self.text = sys.intern(self.text)
 
-@dataclass
-class TableCell:
-    """A single cell in a table."""
-
-    text: str
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {"level": self.level, "text": self.text}
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TableRow:
-    """A row in a table."""
+    """A row in a table, holding the text of each cell."""
+
+    cells: List[str]
 
-    cells: List[TableCell]
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {"cells": self.cells}
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TableContent:
     """A table within document content."""
 
     rows: List[TableRow]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {"rows": [row.to_dict() for row in self.rows]}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class PageContent:
     """Content extracted from a single page."""
 
@@ -51,12 +96,12 @@ class PageContent:
         return {
             "text": self.text,
             "paragraphs": self.paragraphs,
-            "headings": [asdict(heading) for heading in self.headings],
-            "tables": [asdict(table) for table in self.tables],
+            "headings": [heading.to_dict() for heading in self.headings],
+            "tables": [table.to_dict() for table in self.tables],
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PageMetadata:
     """Metadata for a single page."""
 
@@ -65,10 +110,10 @@ class PageMetadata:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {"word_count": self.word_count, "char_count": self.char_count}
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PageResult:
     """Complete result for a single page."""
 
@@ -85,7 +130,7 @@ class PageResult:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DocumentInfo:
     """Information about the parsed document."""
 
@@ -106,7 +151,7 @@ class DocumentInfo:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DocumentResult:
     """Complete result of document parsing."""
 
@@ -130,10 +175,15 @@ class DocumentResult:
         Returns:
             JSON string representation
         """
+        if orjson is not None:
+            # orjson encodes the dataclass tree natively, skipping to_dict()
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            return orjson.dumps(self, option=option).decode("utf-8")
         data = self.to_dict()
         if pretty:
             return json.dumps(data, indent=2, ensure_ascii=False)
-        return json.dumps(data, ensure_ascii=False)
+        # Compact separators match orjson's output
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
 
     def save_to_file(self, filepath: str, pretty: bool = True) -> None:
         """
@@ -143,5 +193,16 @@ class DocumentResult:
             filepath: Path to save the JSON file
             pretty: Whether to format JSON with indentation
         """
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            _write_bytes(filepath, orjson.dumps(self, option=option))
+            return
+
+        # json.dump writes encoded chunks as they are produced
         with open(filepath, "w", encoding="utf-8") as f:
-            f.write(self.to_json(pretty=pretty))
+            if pretty:
+                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(
+                    self.to_dict(), f, separators=(",", ":"), ensure_ascii=False
+                )
@@ -3,19 +3,115 @@ Main document parser class that coordinates different parsers.
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple
+from pathlib import Path, PurePath
+from jinja2 import Environment, Template
 
-from .models import DocumentResult, DocumentInfo
-from ..parsers import PDFParser, DOCXParser, ExcelParser, CSVParser, BaseParser
+from .models import DocumentResult, DocumentInfo, _write_bytes
+from .. import parsers
+from ..parsers import BaseParser
 from ..utils.exceptions import (
     UnsupportedFileTypeError,
     FileNotFoundError as CustomFileNotFoundError,
     DocumentParsingError,
 )
 from ..utils.logging import logger
-from ..utils.templates import TemplateProcessor
+from ..utils.templates import (
+    TemplateProcessor,
+    _compile_template,
+    _get_template_processor,
+)
+
+# Plain environment matching jinja2.Template defaults, for simple templates
+_SIMPLE_ENV = Environment()
+
+# Lowercase extension -> parser class name in the parsers package
+_EXTENSION_PARSERS = {
+    ".pdf": "PDFParser",
+    ".docx": "DOCXParser",
+    ".xlsx": "ExcelParser",
+    ".xls": "ExcelParser",
+    ".xlsm": "ExcelParser",
+    ".csv": "CSVParser",
+}
+
+# Batches smaller than this are rendered in-process; pool startup costs more
+_PROCESS_POOL_MIN_FILES = 4
+
+# Smallest template count worth rendering in worker processes when the
+# render_templates_in_processes option is set
+_PROCESS_POOL_MIN_TEMPLATES = 4
+
+# Parser owned by each batch-render worker process
+_worker_parser: Optional["DocumentParser"] = None
+
+# Template context shared by all tasks of a multi-template worker
+_worker_context: Optional[Dict[str, Any]] = None
+
+
+def _init_render_worker(config: Dict[str, Any]) -> None:
+    """Create the parser used by a batch worker process."""
+    global _worker_parser
+    _worker_parser = DocumentParser(config)
+
+
+def _get_worker_parser() -> "DocumentParser":
+    """Return the parser of an initialized batch worker process."""
+    assert _worker_parser is not None, "worker process not initialized"
+    return _worker_parser
+
+
+def _init_template_worker(
+    config: Dict[str, Any],
+    document_result: DocumentResult,
+    extra_context: Optional[Dict[str, Any]],
+) -> None:
+    """Set up a worker that renders one parsed document with many templates."""
+    global _worker_context
+    _init_render_worker(config)
+    # Build the template context once per worker rather than per template
+    _worker_context = _get_worker_parser()._template_processor._build_context(
+        document_result, extra_context
+    )
+
+
+def _render_template_in_worker(template_filename: str) -> str:
+    """Render the worker's document with one template file."""
+    assert _worker_context is not None, "template worker not initialized"
+    return _get_worker_parser()._render_template_item(
+        template_filename, _worker_context
+    )
+
+
+def _parse_in_worker(file_path: str) -> Optional[DocumentResult]:
+    """Parse one file in a batch-parse worker process; None if it fails."""
+    try:
+        return _get_worker_parser().parse_file(file_path)
+    except Exception as e:
+        logger.error(f"Failed to parse {file_path}: {str(e)}")
+        return None
+
+
+def _parse_and_render(args: Tuple[str, str, Optional[Dict[str, Any]]]) -> str:
+    """Parse and render one file in a batch-render worker process."""
+    file_path, template_filename, extra_context = args
+    parser = _get_worker_parser()
+    template = parser._template_processor.get_template(template_filename)
+    return parser._render_batch_item(
+        file_path, template, template_filename, extra_context
+    )
+
+
+def _batch_error_message(
+    file_path: str, template_filename: str, error: Exception
+) -> str:
+    """Format the result entry for a file that failed to render in a batch."""
+    return (
+        f"Error: Error rendering data file '{file_path}' to template "
+        f"'{template_filename}': {str(error)}"
+    )
 
 
 class DocumentParser:
@@ -31,19 +127,36 @@ class DocumentParser:
         Initialize the document parser.
 
         Args:
-            config: Optional configuration dictionary
+            config: Optional configuration dictionary. Supported keys:
+                template_dir: Directory containing template files
+                max_workers: Worker count for parse_files threads or
+                    processes and batch-render processes (default: the
+                    executor default)
+                pdf_processes: Split long PDFs across worker processes
+                    when parsing with pdfplumber (default: False)
+                parse_in_processes: Parse larger parse_files and
+                    render_multiple_data_files_to_template batches in
+                    worker processes, for CPU-bound pure-Python parsing
+                    (default: False)
+                precompile_templates: Load every template file in
+                    template_dir up front instead of on first render
+                    (default: False)
+                render_templates_in_processes: Render larger
+                    render_data_file_to_multiple_templates batches in
+                    worker processes, for expensive templates
+                    (default: False)
         """
         self.config = config or {}
-        self._parsers: List[BaseParser] = [
-            PDFParser(),
-            DOCXParser(),
-            ExcelParser(),
-            CSVParser(),
-        ]
+
+        # Parsers are created on first use, so their backends are only
+        # imported for the file types actually parsed
+        self._parser_instances: Dict[str, BaseParser] = {}
 
         # Initialize template processor
         template_dir = self.config.get("template_dir")
-        self._template_processor = TemplateProcessor(template_dir)
+        self._template_processor = _get_template_processor(template_dir)
+        if self.config.get("precompile_templates"):
+            self._template_processor.precompile_templates()
 
         logger.info("DocumentParser initialized")
 
@@ -62,8 +175,10 @@ class DocumentParser:
             UnsupportedFileTypeError: If file type is not supported
             DocumentParsingError: If parsing fails
         """
-        # Validate file exists
-        if not os.path.exists(file_path):
+        # Validate file exists; the stat result is reused for the file size
+        try:
+            file_stats = os.stat(file_path)
+        except OSError:
             raise CustomFileNotFoundError(f"File not found: {file_path}", file_path)
 
         # Find appropriate parser
@@ -79,7 +194,7 @@ class DocumentParser:
             pages = parser.parse(file_path)
 
             # Create document info
-            doc_info = self._create_document_info(file_path, len(pages))
+            doc_info = self._create_document_info(file_path, len(pages), file_stats)
 
             # Create and return result
             result = DocumentResult(document_info=doc_info, pages=pages)
@@ -99,24 +214,58 @@ class DocumentParser:
         """
         Parse multiple document files.
 
+        Files are parsed concurrently in a thread pool, since most of the
+        work is file I/O and C extension code that releases the GIL. With
+        the parse_in_processes option, larger batches use worker processes
+        instead. Results are returned in input order; files that fail are
+        logged and skipped.
+
         Args:
             file_paths: List of file paths to parse
 
         Returns:
             List of DocumentResult objects
         """
-        results = []
+        max_workers = self.config.get("max_workers")
 
-        for file_path in file_paths:
+        if (
+            self.config.get("parse_in_processes")
+            and len(file_paths) >= _PROCESS_POOL_MIN_FILES
+        ):
+            # A few chunks per worker keeps the pool busy with little IPC
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(file_paths) // (4 * workers))
             try:
-                result = self.parse_file(file_path)
-                results.append(result)
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_render_worker,
+                    initargs=(self.config,),
+                ) as executor:
+                    results = list(
+                        executor.map(_parse_in_worker, file_paths, chunksize=chunksize)
+                    )
+                return [result for result in results if result is not None]
             except Exception as e:
-                logger.error(f"Failed to parse {file_path}: {str(e)}")
-                # Continue with other files
-                continue
+                logger.warning(
+                    f"Process pool unavailable, parsing in threads: {str(e)}"
+                )
 
-        return results
+        # One slot per input file, so results land in input order directly
+        parsed: List[Optional[DocumentResult]] = [None] * len(file_paths)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.parse_file, file_path): index
+                for index, file_path in enumerate(file_paths)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    parsed[index] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to parse {file_paths[index]}: {str(e)}")
+
+        return [result for result in parsed if result is not None]
 
     def supports_file(self, file_path: str) -> bool:
         """
@@ -128,7 +277,7 @@ class DocumentParser:
         Returns:
             True if file type is supported
         """
-        return self._get_parser_for_file(file_path) is not None
+        return os.path.splitext(file_path)[1].lower() in _EXTENSION_PARSERS
 
     def get_supported_extensions(self) -> List[str]:
         """
@@ -137,20 +286,15 @@ class DocumentParser:
         Returns:
             List of supported extensions (e.g., ['.pdf', '.docx'])
         """
-        extensions = []
-        test_files = {
-            ".pdf": "test.pdf",
-            ".docx": "test.docx",
-            ".xlsx": "test.xlsx",
-            ".xls": "test.xls",
-            ".csv": "test.csv",
-        }
-
-        for ext, test_file in test_files.items():
-            if any(parser.supports_file_type(test_file) for parser in self._parsers):
-                extensions.append(ext)
+        return list(_EXTENSION_PARSERS)
 
-        return extensions
+    @property
+    def _parsers(self) -> List[BaseParser]:
+        """All parser instances, creating any that have not been used yet."""
+        return [
+            self._get_parser(class_name)
+            for class_name in dict.fromkeys(_EXTENSION_PARSERS.values())
+        ]
 
     def _get_parser_for_file(self, file_path: str) -> Optional[BaseParser]:
         """
@@ -162,24 +306,52 @@ class DocumentParser:
         Returns:
             Parser instance or None if unsupported
         """
-        for parser in self._parsers:
-            if parser.supports_file_type(file_path):
-                return parser
-        return None
+        class_name = _EXTENSION_PARSERS.get(os.path.splitext(file_path)[1].lower())
+        if class_name is None:
+            return None
+        return self._get_parser(class_name)
 
-    def _create_document_info(self, file_path: str, total_pages: int) -> DocumentInfo:
+    def _get_parser(self, class_name: str) -> BaseParser:
+        """
+        Get the parser instance for a parser class, creating it on first use.
+
+        Args:
+            class_name: Name of the parser class in the parsers package
+
+        Returns:
+            Parser instance
+        """
+        parser = self._parser_instances.get(class_name)
+        if parser is None:
+            if class_name == "PDFParser":
+                parser = parsers.PDFParser(
+                    use_processes=bool(self.config.get("pdf_processes"))
+                )
+            else:
+                parser = getattr(parsers, class_name)()
+            self._parser_instances[class_name] = parser
+        return parser
+
+    def _create_document_info(
+        self,
+        file_path: str,
+        total_pages: int,
+        file_stats: Optional[os.stat_result] = None,
+    ) -> DocumentInfo:
         """
         Create DocumentInfo object for a file.
 
         Args:
             file_path: Path to the file
             total_pages: Number of pages parsed
+            file_stats: Result of os.stat for the file, if already known
 
         Returns:
             DocumentInfo object
         """
-        path = Path(file_path)
-        file_stats = os.stat(file_path)
+        path = PurePath(file_path)
+        if file_stats is None:
+            file_stats = os.stat(file_path)
 
         # Determine file type from extension
         file_type = path.suffix.lower().replace(".", "")
@@ -326,10 +498,8 @@ class DocumentParser:
                 'date': '2025-07-02'
             })
         """
-        from jinja2 import Template
-
         try:
-            template = Template(template_string)
+            template = _compile_template(_SIMPLE_ENV, template_string)
             rendered = template.render(**context)
             logger.debug("Successfully rendered simple template")
             return rendered
@@ -443,22 +613,79 @@ class DocumentParser:
                 'monthly_report.j2'
             )
         """
-        results = {}
+        # Result keys, computed once for every path below
+        file_names = [os.path.basename(file_path) for file_path in data_file_paths]
 
-        for file_path in data_file_paths:
+        # Resolve the template once rather than once per file
+        try:
+            template = self._template_processor.get_template(template_filename)
+        except Exception as e:
+            logger.error(f"Failed to load template {template_filename}: {str(e)}")
+            return {
+                file_name: _batch_error_message(file_path, template_filename, e)
+                for file_name, file_path in zip(file_names, data_file_paths)
+            }
+
+        if (
+            self.config.get("parse_in_processes")
+            and len(data_file_paths) >= _PROCESS_POOL_MIN_FILES
+        ):
+            # Parsing and rendering are CPU-bound Python, so larger batches
+            # can be spread over worker processes
+            tasks = [
+                (file_path, template_filename, extra_context)
+                for file_path in data_file_paths
+            ]
             try:
-                file_name = Path(file_path).name
-                rendered = self.render_data_file_to_template(
-                    file_path, template_filename, extra_context
+                with ProcessPoolExecutor(
+                    max_workers=self.config.get("max_workers"),
+                    initializer=_init_render_worker,
+                    initargs=(self.config,),
+                ) as executor:
+                    rendered = list(executor.map(_parse_and_render, tasks, chunksize=4))
+                return dict(zip(file_names, rendered))
+            except Exception as e:
+                logger.warning(
+                    f"Process pool unavailable, rendering in-process: {str(e)}"
                 )
-                results[file_name] = rendered
 
-            except Exception as e:
-                logger.error(f"Failed to render {file_path}: {str(e)}")
-                results[Path(file_path).name] = f"Error: {str(e)}"
+        results = {}
+        for file_name, file_path in zip(file_names, data_file_paths):
+            results[file_name] = self._render_batch_item(
+                file_path, template, template_filename, extra_context
+            )
 
         return results
 
+    def _render_batch_item(
+        self,
+        file_path: str,
+        template: Template,
+        template_filename: str,
+        extra_context: Optional[Dict[str, Any]],
+    ) -> str:
+        """
+        Parse one file of a batch and render it with a resolved template.
+
+        Args:
+            file_path: Path to the document file to parse
+            template: Compiled template to render with
+            template_filename: Name of the template file, for error messages
+            extra_context: Additional context variables for the template
+
+        Returns:
+            Rendered template string, or an "Error: ..." message on failure
+        """
+        try:
+            logger.info(f"Parsing data file: {file_path}")
+            document_result = self.parse_file(file_path)
+            return self._template_processor.render_compiled(
+                template, document_result, extra_context
+            )
+        except Exception as e:
+            logger.error(f"Failed to render {file_path}: {str(e)}")
+            return _batch_error_message(file_path, template_filename, e)
+
     def render_data_file_to_multiple_templates(
         self,
         data_file_path: str,
@@ -488,31 +715,70 @@ class DocumentParser:
             logger.info(f"Parsing data file: {data_file_path}")
             document_result = self.parse_file(data_file_path)
 
-            results = {}
+        except Exception as e:
+            raise DocumentParsingError(
+                f"Error parsing data file '{data_file_path}': {str(e)}"
+            )
 
-            # Render with each template
-            for template_filename in template_filenames:
-                try:
-                    rendered = self.render_template_file(
-                        template_filename, document_result, extra_context
+        if (
+            self.config.get("render_templates_in_processes")
+            and len(template_filenames) >= _PROCESS_POOL_MIN_TEMPLATES
+        ):
+            # Ship the parsed document to each worker once, not per template
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=self.config.get("max_workers"),
+                    initializer=_init_template_worker,
+                    initargs=(self.config, document_result, extra_context),
+                ) as executor:
+                    rendered = list(
+                        executor.map(_render_template_in_worker, template_filenames)
                     )
-                    # Use template name without extension as key
-                    template_key = Path(template_filename).stem
-                    results[template_key] = rendered
+                # Use template name without extension as key
+                return {
+                    Path(template_filename).stem: output
+                    for template_filename, output in zip(template_filenames, rendered)
+                }
+            except Exception as e:
+                logger.warning(
+                    f"Process pool unavailable, rendering in-process: {str(e)}"
+                )
 
-                except Exception as e:
-                    logger.error(
-                        f"Failed to render template {template_filename}: {str(e)}"
-                    )
-                    results[Path(template_filename).stem] = f"Error: {str(e)}"
+        results = {}
 
-            return results
+        # Page aggregates in the context are shared by every template
+        context = self._template_processor._build_context(
+            document_result, extra_context
+        )
 
-        except Exception as e:
-            raise DocumentParsingError(
-                f"Error parsing data file '{data_file_path}': {str(e)}"
+        # Render with each template
+        for template_filename in template_filenames:
+            # Use template name without extension as key
+            results[Path(template_filename).stem] = self._render_template_item(
+                template_filename, context
             )
 
+        return results
+
+    def _render_template_item(
+        self, template_filename: str, context: Dict[str, Any]
+    ) -> str:
+        """
+        Render a parsed document with one template of a batch.
+
+        Args:
+            template_filename: Name of the template file
+            context: Template context built once for the parsed document
+
+        Returns:
+            Rendered template string, or an "Error: ..." message on failure
+        """
+        try:
+            return self._template_processor._render_file(template_filename, context)
+        except Exception as e:
+            logger.error(f"Failed to render template {template_filename}: {str(e)}")
+            return f"Error: {str(e)}"
+
     def render_data_file_to_template_with_save(
         self,
         data_file_path: str,
@@ -549,8 +815,8 @@ class DocumentParser:
             output_path = Path(output_file_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(rendered)
+            # Encode once and write straight to the descriptor
+            _write_bytes(str(output_path), rendered.encode("utf-8"))
 
             logger.info(f"Rendered output saved to: {output_file_path}")
             return rendered
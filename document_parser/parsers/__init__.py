@@ -2,11 +2,29 @@
 Parser package initialization.
 """
 
+import importlib
+
 from .base import BaseParser
-from .pdf_parser import PDFParser
-from .docx_parser import DOCXParser
-from .excel_parser import ExcelParser
-from .csv_parser import CSVParser
+
+# Parser class -> module; each module imports a heavy backend (pdfplumber,
+# python-docx, pandas), so it is only imported when the class is accessed
+_PARSER_MODULES = {
+    "PDFParser": ".pdf_parser",
+    "DOCXParser": ".docx_parser",
+    "ExcelParser": ".excel_parser",
+    "CSVParser": ".csv_parser",
+}
+
+
+def __getattr__(name: str):
+    """Import parser classes on first access."""
+    module_name = _PARSER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    parser_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = parser_class
+    return parser_class
+
 
 __all__ = [
     "BaseParser",
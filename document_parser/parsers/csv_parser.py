@@ -2,21 +2,60 @@
 CSV parser implementation using pandas.
 """
 
+import codecs
+import csv
+import io
+import math
 import os
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
+import charset_normalizer
 import pandas as pd
 from .base import BaseParser
-from ..core.models import PageResult, PageContent, PageMetadata, HeadingInfo
+from ..core.models import PageResult, PageContent, HeadingInfo
 from ..utils.exceptions import CorruptedFileError
 from ..utils.logging import logger
 
+try:
+    import pyarrow  # noqa: F401
+
+    # Multi-threaded C++ reader; used once the CSV format is known
+    _CSV_ENGINE = "pyarrow"
+    _CSV_READ_OPTIONS: Dict[str, Any] = {"engine": _CSV_ENGINE}
+except ImportError:
+    _CSV_ENGINE = "c"
+    # The C engine can read through mmap; pyarrow rejects this option
+    _CSV_READ_OPTIONS = {"engine": _CSV_ENGINE, "memory_map": True}
+
+# Byte order marks and their encodings; UTF-32 first as it extends UTF-16's
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Bytes read from the start of a CSV to detect its encoding and delimiter
+_SNIFF_BYTES = 65536
+_SNIFF_DELIMITERS = ",;\t|"
+
+# Files at least this large are read in chunks instead of all at once
+_STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+_STREAM_CHUNK_ROWS = 100_000
+
+# Leading rows shown in the text output
+_DISPLAY_ROWS = 20
+
+# Characters of text output (and of row paragraphs) kept for very wide CSVs
+_TEXT_BUDGET_CHARS = 65536
+
 
 class CSVParser(BaseParser):
     """Parser for CSV files using pandas."""
 
     def supports_file_type(self, file_path: str) -> bool:
         """Check if file is a CSV file."""
-        return file_path.lower().endswith(".csv")
+        return file_path[-4:].lower() == ".csv"
 
     def parse(self, file_path: str) -> List[PageResult]:
         """
@@ -34,24 +73,25 @@ class CSVParser(BaseParser):
         try:
             logger.info(f"Starting CSV parsing for: {file_path}")
 
-            # Try different encodings and separators
-            df = self._read_csv_with_fallback(file_path)
+            if self._should_stream(file_path):
+                # Only the leading rows and running totals are kept in memory
+                content, row_count = self._stream_csv_to_content(file_path)
+            else:
+                # Try different encodings and separators
+                df = self._read_csv_with_fallback(file_path)
+                row_count = len(df)
 
-            # Convert to structured content
-            content = self._dataframe_to_content(df, file_path)
+                # Convert to structured content
+                content = self._dataframe_to_content(df, file_path)
 
             # Calculate metadata
             text = content.text
-            metadata_dict = self._calculate_metadata(text)
-            metadata = PageMetadata(
-                word_count=metadata_dict["word_count"],
-                char_count=metadata_dict["char_count"],
-            )
+            metadata = self._calculate_metadata(text)
 
             # Create page result (CSV is treated as single page)
             page_result = PageResult(page_number=1, content=content, metadata=metadata)
 
-            logger.info(f"Successfully parsed CSV file with {len(df)} rows")
+            logger.info(f"Successfully parsed CSV file with {row_count} rows")
             return [page_result]
 
         except Exception as e:
@@ -59,7 +99,12 @@ class CSVParser(BaseParser):
 
     def _read_csv_with_fallback(self, file_path: str) -> pd.DataFrame:
         """
-        Read CSV with multiple encoding and separator attempts.
+        Read CSV, detecting its encoding and separator up front.
+
+        The format is detected from a sample of the file so the whole file
+        is only read once. If detection fails, or the detected format
+        cannot be read, multiple encoding and separator combinations are
+        tried in turn.
 
         Args:
             file_path: Path to the CSV file
@@ -67,6 +112,21 @@ class CSVParser(BaseParser):
         Returns:
             DataFrame containing CSV data
         """
+        detected = self._detect_csv_format(file_path)
+        if detected is not None:
+            encoding, sep = detected
+            try:
+                df = pd.read_csv(
+                    file_path, encoding=encoding, sep=sep, **_CSV_READ_OPTIONS
+                )
+                logger.debug(
+                    f"Successfully read CSV with detected encoding={encoding}, "
+                    f"separator='{sep}', engine={_CSV_ENGINE}"
+                )
+                return df
+            except Exception as e:
+                logger.debug(f"Detected CSV format failed, trying fallbacks: {str(e)}")
+
         # Common encodings to try
         encodings = ["utf-8", "latin-1", "cp1252", "iso-8859-1"]
         # Common separators to try
@@ -91,6 +151,152 @@ class CSVParser(BaseParser):
         logger.warning(f"Using default CSV settings for {file_path}")
         return pd.read_csv(file_path)
 
+    def _detect_csv_format(self, file_path: str) -> Optional[Tuple[str, str]]:
+        """
+        Detect the encoding and separator of a CSV file from a sample.
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            Tuple of (encoding, separator), or None if detection failed
+        """
+        try:
+            with open(file_path, "rb") as f:
+                sample = f.read(_SNIFF_BYTES)
+        except OSError:
+            return None
+
+        if len(sample) == _SNIFF_BYTES:
+            # Drop the trailing partial line so it can't skew detection
+            sample = sample[: sample.rfind(b"\n") + 1] or sample
+
+        # A byte order mark settles the encoding without statistical detection
+        for bom, encoding in _BOM_ENCODINGS:
+            if sample.startswith(bom):
+                text = sample.decode(encoding, errors="ignore")
+                break
+        else:
+            match = charset_normalizer.from_bytes(sample).best()
+            if match is None:
+                return None
+
+            encoding = match.encoding
+            if encoding == "ascii":
+                # An ASCII sample may still be followed by UTF-8 text
+                encoding = "utf-8"
+            text = str(match)
+
+        try:
+            dialect = csv.Sniffer().sniff(text, delimiters=_SNIFF_DELIMITERS)
+        except csv.Error:
+            return None
+
+        return encoding, dialect.delimiter
+
+    def _should_stream(self, file_path: str) -> bool:
+        """Check if a CSV is large enough to be read in chunks."""
+        try:
+            return os.path.getsize(file_path) >= _STREAM_THRESHOLD_BYTES
+        except OSError:
+            return False
+
+    def _stream_csv_to_content(self, file_path: str) -> Tuple[PageContent, int]:
+        """
+        Convert a large CSV to PageContent without loading it all at once.
+
+        The file is read in chunks. Only the leading rows are kept, and
+        numeric statistics are combined chunk by chunk. Column types come
+        from the first chunk, so a column that turns non-numeric later is
+        dropped from the statistics.
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            Tuple of (PageContent, total row count)
+        """
+        detected = self._detect_csv_format(file_path)
+        if detected is None:
+            # Let the whole-file reader try its encoding fallbacks
+            df = self._read_csv_with_fallback(file_path)
+            return self._dataframe_to_content(df, file_path), len(df)
+
+        encoding, sep = detected
+        sample_df = None
+        row_count = 0
+        numeric_cols: List[Any] = []
+        # column -> [count, mean, M2, min, max]
+        totals: Dict[Any, List[float]] = {}
+
+        for chunk in pd.read_csv(
+            file_path, encoding=encoding, sep=sep, chunksize=_STREAM_CHUNK_ROWS
+        ):
+            if sample_df is None:
+                sample_df = chunk.head(_DISPLAY_ROWS)
+                numeric_cols = list(chunk.select_dtypes(include=["number"]).columns)
+            row_count += len(chunk)
+
+            for col in list(numeric_cols):
+                series = chunk[col]
+                if not pd.api.types.is_numeric_dtype(series):
+                    numeric_cols.remove(col)
+                    totals.pop(col, None)
+                    continue
+                self._merge_column_stats(totals, col, series)
+
+        if sample_df is None:
+            sample_df = pd.read_csv(file_path, encoding=encoding, sep=sep, nrows=0)
+
+        numeric_stats = {}
+        for col in numeric_cols:
+            count, mean, m2, min_val, max_val = totals.get(
+                col, [0, math.nan, 0.0, math.nan, math.nan]
+            )
+            std = math.sqrt(m2 / (count - 1)) if count > 1 else math.nan
+            numeric_stats[col] = (mean, std, min_val, max_val)
+
+        logger.debug(f"Streamed CSV in chunks of {_STREAM_CHUNK_ROWS} rows")
+        content = self._build_content(sample_df, row_count, numeric_stats, file_path)
+        return content, row_count
+
+    @staticmethod
+    def _merge_column_stats(
+        totals: Dict[Any, List[float]], col: Any, series: pd.Series
+    ) -> None:
+        """
+        Fold one chunk of a numeric column into its running statistics.
+
+        Uses the pairwise update of Chan et al. for mean and variance.
+
+        Args:
+            totals: Running [count, mean, M2, min, max] per column
+            col: Column name
+            series: Values of the column in the current chunk
+        """
+        count_b = int(series.count())
+        if count_b == 0:
+            return
+        mean_b = float(series.mean())
+        m2_b = float(((series - mean_b) ** 2).sum())
+        min_b = series.min()
+        max_b = series.max()
+
+        if col not in totals:
+            totals[col] = [count_b, mean_b, m2_b, min_b, max_b]
+            return
+
+        count_a, mean_a, m2_a, min_a, max_a = totals[col]
+        count = count_a + count_b
+        delta = mean_b - mean_a
+        totals[col] = [
+            count,
+            mean_a + delta * count_b / count,
+            m2_a + m2_b + delta * delta * count_a * count_b / count,
+            min(min_a, min_b),
+            max(max_a, max_b),
+        ]
+
     def _dataframe_to_content(self, df: pd.DataFrame, file_path: str) -> PageContent:
         """
         Convert pandas DataFrame to PageContent.
@@ -102,80 +308,132 @@ class CSVParser(BaseParser):
         Returns:
             PageContent object
         """
-        # Generate text representation
-        text_parts = []
+        numeric_stats = {}
+        if not df.empty:
+            numeric_cols = df.select_dtypes(include=["number"]).columns
+            if len(numeric_cols) > 0:
+                # One vectorized reduction for all columns; percentiles unused
+                stats_df = df[numeric_cols].agg(["mean", "std", "min", "max"])
+                numeric_stats = {col: tuple(stats_df[col]) for col in numeric_cols}
+
+        return self._build_content(
+            df.head(_DISPLAY_ROWS), len(df), numeric_stats, file_path
+        )
+
+    def _build_content(
+        self,
+        sample_df: pd.DataFrame,
+        row_count: int,
+        numeric_stats: Dict[Any, Tuple[float, float, float, float]],
+        file_path: str,
+    ) -> PageContent:
+        """
+        Build PageContent from the leading rows and summary of a CSV.
 
-        # Add file name as heading
-        file_name = os.path.basename(file_path)
-        text_parts.append(f"CSV File: {file_name}")
-        text_parts.append("=" * (len(file_name) + 11))
-        text_parts.append("")
+        Args:
+            sample_df: DataFrame holding at least the first rows to display
+            row_count: Total number of data rows in the file
+            numeric_stats: (mean, std, min, max) for each numeric column
+            file_path: Path to the CSV file
 
-        # Add summary statistics
-        text_parts.append(f"Rows: {len(df)}")
-        text_parts.append(f"Columns: {len(df.columns)}")
-        text_parts.append("")
+        Returns:
+            PageContent object
+        """
+        columns = sample_df.columns.tolist()
+        is_empty = row_count == 0 or len(columns) == 0
+
+        # Generate text representation in a single buffer, capped so very
+        # wide files can't produce an unbounded preview
+        buf = io.StringIO()
+        remaining = _TEXT_BUDGET_CHARS
+
+        def write(text: str) -> bool:
+            """Append text within the budget; return False once it is spent."""
+            nonlocal remaining
+            if remaining <= 0:
+                return False
+            if len(text) > remaining:
+                buf.write(text[:remaining])
+                buf.write("\n... (truncated)\n")
+                remaining = 0
+                return False
+            buf.write(text)
+            remaining -= len(text)
+            return True
+
+        # Add file name as heading and summary statistics
+        file_name = os.path.basename(file_path)
+        write(
+            f"CSV File: {file_name}\n{'=' * (len(file_name) + 11)}\n\n"
+            f"Rows: {row_count}\nColumns: {len(columns)}\n\n"
+        )
 
         # Add column headers
-        if not df.empty and len(df.columns) > 0:
-            headers = " | ".join(str(col) for col in df.columns)
-            text_parts.append("Headers:")
-            text_parts.append(headers)
-            text_parts.append("-" * len(headers))
-            text_parts.append("")
+        if not is_empty:
+            headers = " | ".join(str(col) for col in columns)
+            write(f"Headers:\n{headers}\n{'-' * len(headers)}\n\n")
 
             # Add sample data rows (first 20 rows)
-            max_display_rows = min(len(df), 20)
-            text_parts.append("Data:")
-            for index, row in df.head(max_display_rows).iterrows():
+            max_display_rows = min(row_count, _DISPLAY_ROWS)
+            write("Data:\n")
+            for row in sample_df.head(max_display_rows).itertuples(
+                index=False, name=None
+            ):
                 row_text = " | ".join(str(val) if pd.notna(val) else "" for val in row)
-                text_parts.append(row_text)
+                if not write(row_text + "\n"):
+                    break
 
-            if len(df) > max_display_rows:
-                text_parts.append(f"... ({len(df) - max_display_rows} more rows)")
+            if row_count > max_display_rows:
+                write(f"... ({row_count - max_display_rows} more rows)\n")
 
             # Add column statistics for numeric columns
-            numeric_cols = df.select_dtypes(include=["number"]).columns
-            if len(numeric_cols) > 0:
-                text_parts.append("")
-                text_parts.append("Numeric Column Statistics:")
-                for col in numeric_cols:
-                    stats = df[col].describe()
-                    text_parts.append(
-                        f"{col}: mean={stats['mean']:.2f}, std={stats['std']:.2f}, min={stats['min']:.2f}, max={stats['max']:.2f}"
+            if numeric_stats:
+                write("\nNumeric Column Statistics:\n")
+                for col, (mean, std, min_val, max_val) in numeric_stats.items():
+                    write(
+                        f"{col}: mean={mean:.2f}, std={std:.2f}, "
+                        f"min={min_val:.2f}, max={max_val:.2f}\n"
                     )
         else:
-            text_parts.append("(Empty CSV file)")
+            write("(Empty CSV file)\n")
 
-        full_text = "\n".join(text_parts)
+        # Every line above ends with a newline; drop the final one
+        full_text = buf.getvalue()[:-1]
 
         # Create paragraphs
         paragraphs = []
-        if not df.empty:
+        if not is_empty:
             # Summary paragraph
             paragraphs.append(
-                f"CSV file with {len(df)} rows and {len(df.columns)} columns"
+                f"CSV file with {row_count} rows and {len(columns)} columns"
             )
 
             # Header paragraph
-            if len(df.columns) > 0:
-                headers = ", ".join(str(col) for col in df.columns)
+            if len(columns) > 0:
+                headers = ", ".join(str(col) for col in columns)
                 paragraphs.append(f"Columns: {headers}")
 
             # Sample data paragraphs (limit to avoid too many)
-            max_rows = min(len(df), 10)
-            for index, row in df.head(max_rows).iterrows():
+            max_rows = min(row_count, 10)
+            paragraph_chars = 0
+            for row in sample_df.head(max_rows).itertuples(index=False, name=None):
+                if paragraph_chars >= _TEXT_BUDGET_CHARS:
+                    break
                 row_values = [str(val) if pd.notna(val) else "" for val in row]
                 if any(val.strip() for val in row_values):  # Only non-empty rows
-                    row_dict = dict(zip(df.columns, row_values))
                     # Create a readable sentence from the row
                     row_description = ", ".join(
-                        [f"{k}: {v}" for k, v in row_dict.items() if v.strip()]
+                        [
+                            f"{k}: {v}"
+                            for k, v in zip(columns, row_values)
+                            if v.strip()
+                        ]
                     )
                     paragraphs.append(row_description)
+                    paragraph_chars += len(row_description)
 
-            if len(df) > max_rows:
-                paragraphs.append(f"Additional {len(df) - max_rows} rows available")
+            if row_count > max_rows:
+                paragraphs.append(f"Additional {row_count - max_rows} rows available")
 
         # Create headings
         headings = [
@@ -183,9 +441,9 @@ class CSVParser(BaseParser):
         ]
 
         # Add column headers as level 2 headings
-        if not df.empty and len(df.columns) > 0:
+        if not is_empty:
             headings.append(HeadingInfo(level=2, text="Data Columns"))
-            for col in df.columns:
+            for col in columns:
                 if str(col).strip():
                     headings.append(HeadingInfo(level=3, text=str(col)))
 
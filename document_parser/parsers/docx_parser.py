@@ -1,21 +1,226 @@
 """
-DOCX parser implementation using python-docx.
+DOCX parser implementation reading the package XML, with python-docx as fallback.
 """
 
-from typing import List, Dict, Any
-from docx import Document
+import posixpath
+import re
+import zipfile
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 from .base import BaseParser
-from ..core.models import PageResult, PageContent, PageMetadata, HeadingInfo
+from ..core.models import (
+    PageResult,
+    PageContent,
+    PageMetadata,
+    HeadingInfo,
+    TableContent,
+    TableRow,
+)
 from ..utils.exceptions import CorruptedFileError
 from ..utils.logging import logger
 
+if TYPE_CHECKING:
+    from docx.document import Document
+
+# Heading styles ("Heading", "Heading 2", ...); the level is the trailing number
+_HEADING_RE = re.compile(r"Heading(?:.*\s(\d+)$)?")
+
+# WordprocessingML names used by the streaming reader
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_PACKAGE_RELS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_OFFICE_DOCUMENT_REL = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+    "officeDocument"
+)
+_STYLES_REL = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles"
+)
+
+# Run children and their text, as python-docx renders them; w:br is
+# handled separately since only line breaks produce text
+_RUN_TEXT = {
+    _W + "cr": "\n",
+    _W + "noBreakHyphen": "-",
+    _W + "ptab": "\t",
+    _W + "tab": "\t",
+}
+
+# Built-in style names stored in lowercase, shown title-cased by Word
+_UI_STYLE_NAMES = {
+    name.lower(): name
+    for name in ["Caption", "Footer", "Header"]
+    + [f"Heading {level}" for level in range(1, 10)]
+}
+
+# A streamed paragraph: raw text, style name, and whether it has a "\f" run
+DocxParagraph = Tuple[str, str, bool]
+
+
+def _part_targets(archive: zipfile.ZipFile, part_name: str) -> Dict[str, str]:
+    """
+    Map relationship types of a package part to the part names they target.
+
+    Args:
+        archive: Opened DOCX package
+        part_name: Name of the source part, or "" for the package itself
+
+    Returns:
+        Dictionary of relationship type to target part name
+    """
+    from lxml import etree
+
+    base_dir, file_name = posixpath.split(part_name)
+    rels_name = posixpath.join(base_dir, "_rels", f"{file_name}.rels")
+    if rels_name not in archive.namelist():
+        return {}
+
+    targets: Dict[str, str] = {}
+    for rel in etree.fromstring(archive.read(rels_name)):
+        rel_type = rel.get("Type")
+        target = rel.get("Target")
+        if rel_type is None or target is None or rel.get("TargetMode") == "External":
+            continue
+        if target.startswith("/"):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(base_dir, target))
+        targets.setdefault(rel_type, target)
+    return targets
+
+
+def _paragraph_style_names(
+    archive: zipfile.ZipFile, styles_part: Optional[str]
+) -> Tuple[Dict[str, str], str]:
+    """
+    Read paragraph style names from the styles part.
+
+    Args:
+        archive: Opened DOCX package
+        styles_part: Name of the styles part, if the document has one
+
+    Returns:
+        Tuple of (style ID to name dictionary, default paragraph style name)
+    """
+    from lxml import etree
+
+    names: Dict[str, str] = {}
+    default_name = ""
+    if styles_part is None:
+        return names, default_name
+
+    for style in etree.fromstring(archive.read(styles_part)).iter(_W + "style"):
+        if style.get(_W + "type", "paragraph") != "paragraph":
+            continue
+        name_element = style.find(_W + "name")
+        name = "" if name_element is None else name_element.get(_W + "val", "")
+        name = _UI_STYLE_NAMES.get(name, name)
+        style_id = style.get(_W + "styleId")
+        if style_id is not None:
+            names.setdefault(style_id, name)
+        if style.get(_W + "default") in ("1", "true", "on"):
+            default_name = name
+    return names, default_name
+
+
+def _run_text(run) -> str:
+    """
+    Render a w:r element's text the way python-docx's Run.text does.
+
+    Args:
+        run: w:r element
+
+    Returns:
+        Text of the run
+    """
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == _W + "t":
+            parts.append(child.text or "")
+        elif tag == _W + "br":
+            if child.get(_W + "type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif tag in _RUN_TEXT:
+            parts.append(_RUN_TEXT[tag])
+    return "".join(parts)
+
+
+def _iter_docx_paragraphs(file_path: str) -> Iterator[DocxParagraph]:
+    """
+    Stream the body paragraphs of a DOCX file straight from its XML.
+
+    Only what the parser needs is read, and each top-level body element is
+    discarded once handled, so memory stays flat for large documents.
+
+    Args:
+        file_path: Path to the DOCX file
+
+    Yields:
+        (raw text, style name, has page break run) for each body paragraph
+    """
+    from lxml import etree
+
+    with zipfile.ZipFile(file_path) as archive:
+        document_part = _part_targets(archive, "")[_OFFICE_DOCUMENT_REL]
+        style_names, default_style = _paragraph_style_names(
+            archive, _part_targets(archive, document_part).get(_STYLES_REL)
+        )
+
+        body_tag = _W + "body"
+        with archive.open(document_part) as source:
+            for _, element in etree.iterparse(
+                source, events=("end",), tag=(_W + "p", _W + "tbl", _W + "sdt")
+            ):
+                parent = element.getparent()
+                if parent is None or parent.tag != body_tag:
+                    continue
+
+                if element.tag == _W + "p":
+                    run_texts = []
+                    page_break = False
+                    for child in element:
+                        if child.tag == _W + "r":
+                            text = _run_text(child)
+                            page_break = page_break or text == "\f"
+                            run_texts.append(text)
+                        elif child.tag == _W + "hyperlink":
+                            run_texts.extend(
+                                _run_text(run)
+                                for run in child.iterchildren(_W + "r")
+                            )
+
+                    # Paragraphs without w:pPr/w:pStyle, or with a style ID
+                    # the styles part lacks, use the default paragraph style
+                    style_name = default_style
+                    style_element = element.find(f"{_W}pPr/{_W}pStyle")
+                    if style_element is not None:
+                        style_id = style_element.get(_W + "val")
+                        if style_id is not None:
+                            style_name = style_names.get(style_id, default_style)
+                    yield "".join(run_texts), style_name, page_break
+
+                # Drop handled body content so the tree never grows
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
+
 
 class DOCXParser(BaseParser):
     """Parser for DOCX files using python-docx."""
 
     def supports_file_type(self, file_path: str) -> bool:
         """Check if file is a DOCX."""
-        return file_path.lower().endswith(".docx")
+        return file_path[-5:].lower() == ".docx"
 
     def parse(self, file_path: str) -> List[PageResult]:
         """
@@ -36,10 +241,23 @@ class DOCXParser(BaseParser):
         try:
             logger.info(f"Starting DOCX parsing for: {file_path}")
 
-            doc = Document(file_path)
+            try:
+                # Read paragraphs straight from the package XML, skipping
+                # python-docx's object model
+                all_content = self._extract_structured_content(
+                    _iter_docx_paragraphs(file_path)
+                )
+            except Exception as e:
+                logger.debug(f"Streaming DOCX read failed, using python-docx: {e}")
 
-            # Extract all content with structure information
-            all_content = self._extract_structured_content(doc)
+                # Imported on first use so python-docx only loads for
+                # packages the streaming reader cannot handle
+                from docx import Document
+
+                doc = Document(file_path)
+                all_content = self._extract_structured_content(
+                    self._iter_document_paragraphs(doc)
+                )
 
             # Since DOCX doesn't have explicit pages, we'll create logical pages
             # based on content structure (sections, page breaks, or content length)
@@ -51,22 +269,51 @@ class DOCXParser(BaseParser):
         except Exception as e:
             raise CorruptedFileError(f"Failed to parse DOCX file: {str(e)}", file_path)
 
-    def _extract_structured_content(self, doc: Document) -> Dict[str, Any]:
+    @staticmethod
+    def _iter_document_paragraphs(doc: "Document") -> Iterator[DocxParagraph]:
         """
-        Extract structured content from DOCX document.
+        Yield the body paragraphs of a python-docx Document.
 
         Args:
             doc: Document object
 
+        Yields:
+            (raw text, style name, has page break run) for each body paragraph
+        """
+        for paragraph in doc.paragraphs:
+            raw_text = paragraph.text
+            # The runs are only walked when the paragraph text holds a form feed
+            page_break = "\f" in raw_text and any(
+                run.text == "\f" for run in paragraph.runs
+            )
+            style = paragraph.style
+            style_name = style.name if style is not None and style.name else ""
+            yield raw_text, style_name, page_break
+
+    def _extract_structured_content(
+        self, paragraphs: Iterable[DocxParagraph]
+    ) -> Dict[str, Any]:
+        """
+        Extract structured content from DOCX paragraphs.
+
+        Args:
+            paragraphs: (raw text, style name, has page break run) per paragraph
+
         Returns:
             Dictionary with structured content
         """
-        content = {"paragraphs": [], "headings": [], "text": "", "page_breaks": []}
+        content: Dict[str, Any] = {
+            "paragraphs": [],
+            "headings": [],
+            "heading_positions": [],
+            "text": "",
+            "page_breaks": [],
+        }
 
         full_text = []
 
-        for i, paragraph in enumerate(doc.paragraphs):
-            text = paragraph.text.strip()
+        for i, (raw_text, style_name, page_break) in enumerate(paragraphs):
+            text = raw_text.strip()
 
             if not text:
                 continue
@@ -75,16 +322,15 @@ class DOCXParser(BaseParser):
             content["paragraphs"].append(text)
 
             # Check if this is a heading
-            if paragraph.style.name.startswith("Heading"):
-                level = (
-                    int(paragraph.style.name.split()[-1])
-                    if paragraph.style.name.split()[-1].isdigit()
-                    else 1
-                )
+            match = _HEADING_RE.match(style_name)
+            if match:
+                level = int(match.group(1)) if match.group(1) else 1
                 content["headings"].append(HeadingInfo(level=level, text=text))
+                # Index of the heading's own entry in content["paragraphs"]
+                content["heading_positions"].append(len(content["paragraphs"]) - 1)
 
             # Check for page breaks (this is a simplified approach)
-            if any(run.text == "\f" for run in paragraph.runs):
+            if page_break:
                 content["page_breaks"].append(i)
 
         content["text"] = "\n".join(full_text)
@@ -102,18 +348,29 @@ class DOCXParser(BaseParser):
         """
         pages = []
         paragraphs = content["paragraphs"]
-        headings = content["headings"]
         page_breaks = content["page_breaks"]
 
+        # word_offsets[k] is the number of words in paragraphs[:k]; each
+        # paragraph is split once, and a page's word count is a subtraction
+        word_offsets = list(
+            accumulate((len(paragraph.split()) for paragraph in paragraphs), initial=0)
+        )
+
         # If we have explicit page breaks, use them
         if page_breaks:
             current_start = 0
             page_num = 1
 
             for break_pos in page_breaks + [len(paragraphs)]:
+                break_pos = min(break_pos, len(paragraphs))
                 page_paragraphs = paragraphs[current_start:break_pos]
                 if page_paragraphs:
-                    page = self._create_page_result(page_num, page_paragraphs, headings)
+                    page = self._create_page_result(
+                        page_num,
+                        page_paragraphs,
+                        self._headings_in_range(content, current_start, break_pos),
+                        word_offsets[break_pos] - word_offsets[current_start],
+                    )
                     pages.append(page)
                     page_num += 1
                 current_start = break_pos
@@ -121,33 +378,27 @@ class DOCXParser(BaseParser):
             # No explicit page breaks, create logical pages based on content length
             # Target approximately 500 words per page
             target_words_per_page = 500
-            current_paragraphs = []
-            current_word_count = 0
             page_num = 1
 
-            for paragraph in paragraphs:
-                word_count = len(paragraph.split())
-
-                # If adding this paragraph would exceed target, create a new page
-                if (
-                    current_word_count + word_count > target_words_per_page
-                    and current_paragraphs
-                ):
-                    page = self._create_page_result(
-                        page_num, current_paragraphs, headings
-                    )
-                    pages.append(page)
-                    current_paragraphs = []
-                    current_word_count = 0
-                    page_num += 1
-
-                current_paragraphs.append(paragraph)
-                current_word_count += word_count
-
-            # Add the last page if there's remaining content
-            if current_paragraphs:
-                page = self._create_page_result(page_num, current_paragraphs, headings)
+            current_start = 0
+            while current_start < len(paragraphs):
+                # A page ends before the first paragraph that would take it past
+                # the target, but always holds at least one paragraph; the ends
+                # are found by bisection instead of a per-paragraph loop
+                limit = word_offsets[current_start] + target_words_per_page
+                page_end = max(
+                    bisect_right(word_offsets, limit, lo=current_start + 1) - 1,
+                    current_start + 1,
+                )
+                page = self._create_page_result(
+                    page_num,
+                    paragraphs[current_start:page_end],
+                    self._headings_in_range(content, current_start, page_end),
+                    word_offsets[page_end] - word_offsets[current_start],
+                )
                 pages.append(page)
+                current_start = page_end
+                page_num += 1
 
         # If no pages were created, create at least one empty page
         if not pages:
@@ -156,8 +407,32 @@ class DOCXParser(BaseParser):
 
         return pages
 
+    @staticmethod
+    def _headings_in_range(
+        content: Dict[str, Any], start: int, stop: int
+    ) -> List[HeadingInfo]:
+        """
+        Select the headings whose paragraphs fall within a slice of the document.
+
+        Args:
+            content: Structured content dictionary
+            start: Index of the first paragraph in the slice
+            stop: Index one past the last paragraph in the slice
+
+        Returns:
+            List of HeadingInfo objects, in document order
+        """
+        positions = content["heading_positions"]
+        return content["headings"][
+            bisect_left(positions, start) : bisect_left(positions, stop)
+        ]
+
     def _create_page_result(
-        self, page_num: int, paragraphs: List[str], all_headings: List[HeadingInfo]
+        self,
+        page_num: int,
+        paragraphs: List[str],
+        headings: List[HeadingInfo],
+        word_count: Optional[int] = None,
     ) -> PageResult:
         """
         Create a PageResult from paragraphs and headings.
@@ -165,27 +440,26 @@ class DOCXParser(BaseParser):
         Args:
             page_num: Page number
             paragraphs: List of paragraph texts
-            all_headings: All headings in the document
+            headings: Headings that belong to these paragraphs
+            word_count: Precomputed word count of the paragraphs, if known
 
         Returns:
             PageResult object
         """
         text = "\n\n".join(paragraphs)
 
-        # Filter headings that appear in this page's content
-        page_headings = [heading for heading in all_headings if heading.text in text]
+        content = PageContent(text=text, paragraphs=paragraphs, headings=headings)
 
-        content = PageContent(text=text, paragraphs=paragraphs, headings=page_headings)
-
-        metadata_dict = self._calculate_metadata(text)
-        metadata = PageMetadata(
-            word_count=metadata_dict["word_count"],
-            char_count=metadata_dict["char_count"],
-        )
+        # Paragraphs are joined by whitespace, so their word counts add up
+        # to the page's and the joined text need not be split again
+        if word_count is None:
+            metadata = self._calculate_metadata(text)
+        else:
+            metadata = PageMetadata(word_count=word_count, char_count=len(text))
 
         return PageResult(page_number=page_num, content=content, metadata=metadata)
 
-    def _process_table(self, table) -> Any:
+    def _process_table(self, table) -> TableContent:
         """
         Process a DOCX table and convert it to structured format.
 
@@ -195,18 +469,13 @@ class DOCXParser(BaseParser):
         Returns:
             Table content object with rows and cells
         """
-        from ..core.models import TableContent, TableRow, TableCell
-
-        rows = []
-        for row in table.rows:
-            cells = []
-            for cell in row.cells:
-                table_cell = TableCell(text=cell.text.strip())
-                cells.append(table_cell)
-            table_row = TableRow(cells=cells)
-            rows.append(table_row)
-
-        return TableContent(rows=rows)
+        # Cells stay plain strings; the only object per row is the TableRow
+        return TableContent(
+            rows=[
+                TableRow(cells=[cell.text.strip() for cell in row.cells])
+                for row in table.rows
+            ]
+        )
 
     def _extract_headings_from_paragraphs(self, paragraphs) -> List[HeadingInfo]:
         """
@@ -221,18 +490,13 @@ class DOCXParser(BaseParser):
         headings = []
 
         for paragraph in paragraphs:
-            style_name = paragraph.style.name
-
             # Check if paragraph is a heading style
-            if style_name.startswith("Heading"):
-                try:
-                    # Extract heading level from style name (e.g., "Heading 1" -> 1)
-                    level = int(style_name.split()[-1])
-                    heading = HeadingInfo(level=level, text=paragraph.text.strip())
-                    headings.append(heading)
-                except (ValueError, IndexError):
-                    # If we can't parse the level, treat as level 1
-                    heading = HeadingInfo(level=1, text=paragraph.text.strip())
-                    headings.append(heading)
+            match = _HEADING_RE.match(paragraph.style.name)
+            if match:
+                # Extract heading level from style name (e.g., "Heading 1" -> 1);
+                # if there is no level, treat as level 1
+                level = int(match.group(1)) if match.group(1) else 1
+                heading = HeadingInfo(level=level, text=paragraph.text.strip())
+                headings.append(heading)
 
         return headings
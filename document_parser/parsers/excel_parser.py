@@ -2,20 +2,28 @@
 Excel parser implementation using pandas.
 """
 
-from typing import List
+from typing import List, Optional
 import pandas as pd
 from .base import BaseParser
-from ..core.models import PageResult, PageContent, PageMetadata, HeadingInfo
+from ..core.models import PageResult, PageContent, HeadingInfo
 from ..utils.exceptions import CorruptedFileError
 from ..utils.logging import logger
 
+try:
+    import python_calamine  # noqa: F401
+
+    # Rust workbook reader; pandas falls back to openpyxl/xlrd without it
+    _EXCEL_ENGINE: Optional[str] = "calamine"
+except ImportError:
+    _EXCEL_ENGINE = None
+
 
 class ExcelParser(BaseParser):
     """Parser for Excel files using pandas."""
 
     def supports_file_type(self, file_path: str) -> bool:
         """Check if file is an Excel file."""
-        return file_path.lower().endswith((".xlsx", ".xls", ".xlsm"))
+        return file_path[-5:].lower().endswith((".xlsx", ".xls", ".xlsm"))
 
     def parse(self, file_path: str) -> List[PageResult]:
         """
@@ -33,39 +41,54 @@ class ExcelParser(BaseParser):
         try:
             logger.info(f"Starting Excel parsing for: {file_path}")
 
-            # Read all sheets from Excel file
-            excel_file = pd.ExcelFile(file_path)
-            pages = []
+            # Open the workbook once; pandas' openpyxl reader already loads
+            # it read-only with cached values, so each sheet streams its rows
+            excel_file = pd.ExcelFile(file_path, engine=_EXCEL_ENGINE)
+            try:
+                pages = self._parse_sheets(excel_file)
+            finally:
+                excel_file.close()
 
-            for sheet_num, sheet_name in enumerate(excel_file.sheet_names, 1):
-                logger.debug(f"Processing sheet {sheet_num}: {sheet_name}")
+            logger.info(f"Successfully parsed {len(pages)} sheets from Excel file")
+            return pages
 
-                # Read the sheet
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
+        except Exception as e:
+            raise CorruptedFileError(f"Failed to parse Excel file: {str(e)}", file_path)
 
-                # Convert to structured content
-                content = self._dataframe_to_content(df, sheet_name)
+    def _parse_sheets(self, excel_file: pd.ExcelFile) -> List[PageResult]:
+        """
+        Parse every sheet of an opened workbook.
 
-                # Calculate metadata
-                text = content.text
-                metadata_dict = self._calculate_metadata(text)
-                metadata = PageMetadata(
-                    word_count=metadata_dict["word_count"],
-                    char_count=metadata_dict["char_count"],
-                )
+        Args:
+            excel_file: Workbook opened with pd.ExcelFile
 
-                # Create page result (treating each sheet as a page)
-                page_result = PageResult(
-                    page_number=sheet_num, content=content, metadata=metadata
-                )
+        Returns:
+            List of PageResult objects (one per sheet)
+        """
+        pages = []
 
-                pages.append(page_result)
+        for sheet_num, sheet_name in enumerate(excel_file.sheet_names, 1):
+            logger.debug("Processing sheet %s: %s", sheet_num, sheet_name)
 
-            logger.info(f"Successfully parsed {len(pages)} sheets from Excel file")
-            return pages
+            # Read the sheet from the already opened workbook instead of
+            # re-opening the archive and re-parsing shared strings per sheet
+            df = pd.read_excel(excel_file, sheet_name=sheet_name)
 
-        except Exception as e:
-            raise CorruptedFileError(f"Failed to parse Excel file: {str(e)}", file_path)
+            # Convert to structured content
+            content = self._dataframe_to_content(df, sheet_name)
+
+            # Calculate metadata
+            text = content.text
+            metadata = self._calculate_metadata(text)
+
+            # Create page result (treating each sheet as a page)
+            page_result = PageResult(
+                page_number=sheet_num, content=content, metadata=metadata
+            )
+
+            pages.append(page_result)
+
+        return pages
 
     def _dataframe_to_content(self, df: pd.DataFrame, sheet_name: str) -> PageContent:
         """
@@ -86,16 +109,18 @@ class ExcelParser(BaseParser):
         text_parts.append("=" * (len(sheet_name) + 7))
         text_parts.append("")
 
+        # Cell strings for the whole sheet, built column by column rather
+        # than through a Python call per cell; missing values render as ""
+        cells = df.astype(object).where(df.notna(), "").astype(str)
+        headers = " | ".join(df.columns.astype(str))
+
         # Add column headers
         if not df.empty and len(df.columns) > 0:
-            headers = " | ".join(str(col) for col in df.columns)
             text_parts.append(headers)
             text_parts.append("-" * len(headers))
 
             # Add data rows
-            for index, row in df.iterrows():
-                row_text = " | ".join(str(val) if pd.notna(val) else "" for val in row)
-                text_parts.append(row_text)
+            text_parts.extend(self._join_rows(cells))
         else:
             text_parts.append("(Empty sheet)")
 
@@ -106,16 +131,15 @@ class ExcelParser(BaseParser):
         if not df.empty:
             # Header paragraph
             if len(df.columns) > 0:
-                headers = " | ".join(str(col) for col in df.columns)
                 paragraphs.append(f"Headers: {headers}")
 
             # Data paragraphs (limit to avoid too many paragraphs)
             max_rows = min(len(df), 50)  # Limit to first 50 rows for readability
-            for index, row in df.head(max_rows).iterrows():
-                row_values = [str(val) if pd.notna(val) else "" for val in row]
-                if any(val.strip() for val in row_values):  # Only non-empty rows
-                    row_text = " | ".join(row_values)
-                    paragraphs.append(row_text)
+            head = cells.head(max_rows)
+            non_empty = (
+                head.apply(lambda col: col.str.strip()).ne("").any(axis=1)
+            )  # Only non-empty rows
+            paragraphs.extend(self._join_rows(head[non_empty]))
 
             if len(df) > max_rows:
                 paragraphs.append(f"... ({len(df) - max_rows} more rows)")
@@ -130,3 +154,22 @@ class ExcelParser(BaseParser):
                     headings.append(HeadingInfo(level=2, text=str(col)))
 
         return PageContent(text=full_text, paragraphs=paragraphs, headings=headings)
+
+    @staticmethod
+    def _join_rows(cells: pd.DataFrame) -> List[str]:
+        """
+        Join each row of a string DataFrame with " | " separators.
+
+        Args:
+            cells: DataFrame whose values are all strings
+
+        Returns:
+            List with one joined string per row
+        """
+        if cells.empty or len(cells.columns) == 0:
+            return []
+
+        rows = cells.iloc[:, 0]
+        for position in range(1, len(cells.columns)):
+            rows = rows + " | " + cells.iloc[:, position]
+        return rows.tolist()
@@ -1,21 +1,79 @@
 """
-PDF parser implementation using pdfplumber.
+PDF parser implementation using PyMuPDF or poppler's pdftotext, falling back
+to pdfplumber.
 """
 
-from typing import List
-import pdfplumber
+import os
+import re
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import parent_process
+from typing import List, Optional
 from .base import BaseParser
 from ..core.models import PageResult, PageContent, PageMetadata, HeadingInfo
 from ..utils.exceptions import CorruptedFileError, PasswordProtectedError
 from ..utils.logging import logger
 
+try:
+    # MuPDF's C text extractor is much faster than pdfminer's Python layout
+    import pymupdf
+except ImportError:  # pragma: no cover - optional dependency
+    pymupdf = None  # type: ignore[assignment]
+
+# poppler's C++ extractor, run as a subprocess when the binary is on PATH
+_PDFTOTEXT = shutil.which("pdftotext")
+_PDFTOTEXT_TIMEOUT = 60
+
+# Line prefixes that mark a heading; numbered prefixes are level 2
+_HEADING_PREFIX_RE = re.compile(r"Chapter|Section|(?P<num>[123]\.)")
+
+# pdfminer is pure Python, so long documents can be split across processes
+# when enabled, but only from the main thread of the main process: forking
+# from a parse_files thread can deadlock, and pools must not nest
+_PROCESS_POOL_MIN_PAGES = 16
+_PROCESS_POOL_MAX_WORKERS = 8
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract the text of a contiguous range of pages in a worker process.
+
+    Args:
+        file_path: Path to the PDF file
+        start: 1-based number of the first page to extract
+        stop: 1-based number one past the last page to extract
+
+    Returns:
+        List of page texts, in page order
+    """
+    import pdfplumber
+
+    texts = []
+    with pdfplumber.open(file_path, pages=list(range(start, stop))) as pdf:
+        for page in pdf.pages:
+            texts.append(page.extract_text() or "")
+            page.close()
+    return texts
+
 
 class PDFParser(BaseParser):
-    """Parser for PDF files using pdfplumber."""
+    """Parser for PDF files using PyMuPDF or pdftotext if available, else pdfplumber."""
+
+    def __init__(self, use_processes: bool = False) -> None:
+        """
+        Initialize the PDF parser.
+
+        Args:
+            use_processes: Split long documents across worker processes
+                when falling back to pdfplumber (default: False)
+        """
+        self.use_processes = use_processes
 
     def supports_file_type(self, file_path: str) -> bool:
         """Check if file is a PDF."""
-        return file_path.lower().endswith(".pdf")
+        return file_path[-4:].lower() == ".pdf"
 
     def parse(self, file_path: str) -> List[PageResult]:
         """
@@ -34,43 +92,23 @@ class PDFParser(BaseParser):
         try:
             logger.info(f"Starting PDF parsing for: {file_path}")
 
-            with pdfplumber.open(file_path) as pdf:
-                pages = []
-
-                for page_num, page in enumerate(pdf.pages, 1):
-                    logger.debug(f"Processing page {page_num}")
-
-                    # Extract text
-                    text = page.extract_text() or ""
-
-                    # Extract paragraphs (split by double newlines)
-                    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-
-                    # Extract headings (basic heuristic - lines that are short and in caps)
-                    headings = self._extract_headings(text)
-
-                    # Create page content
-                    content = PageContent(
-                        text=text, paragraphs=paragraphs, headings=headings
-                    )
-
-                    # Calculate metadata
-                    metadata_dict = self._calculate_metadata(text)
-                    metadata = PageMetadata(
-                        word_count=metadata_dict["word_count"],
-                        char_count=metadata_dict["char_count"],
-                    )
-
-                    # Create page result
-                    page_result = PageResult(
-                        page_number=page_num, content=content, metadata=metadata
-                    )
-
-                    pages.append(page_result)
+            if pymupdf is not None:
+                pages = self._parse_with_pymupdf(file_path)
+            else:
+                page_texts = self._try_pdftotext(file_path)
+                if page_texts is not None:
+                    pages = [
+                        self._build_page_result(page_num, text)
+                        for page_num, text in enumerate(page_texts, 1)
+                    ]
+                else:
+                    pages = self._parse_with_pdfplumber(file_path)
 
-                logger.info(f"Successfully parsed {len(pages)} pages from PDF")
-                return pages
+            logger.info(f"Successfully parsed {len(pages)} pages from PDF")
+            return pages
 
+        except PasswordProtectedError:
+            raise
         except Exception as e:
             if "password" in str(e).lower():
                 raise PasswordProtectedError(
@@ -81,6 +119,200 @@ class PDFParser(BaseParser):
                     f"Failed to parse PDF file: {str(e)}", file_path
                 )
 
+    def _parse_with_pymupdf(self, file_path: str) -> List[PageResult]:
+        """
+        Extract pages with PyMuPDF.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Returns:
+            List of PageResult objects
+
+        Raises:
+            PasswordProtectedError: If PDF is password protected
+        """
+        doc = pymupdf.open(file_path)
+        try:
+            if doc.needs_pass:
+                raise PasswordProtectedError(
+                    f"PDF file is password protected: {file_path}", file_path
+                )
+
+            pages = []
+            for page_num, page in enumerate(doc.pages(), 1):
+                logger.debug("Processing page %s", page_num)
+                # MuPDF ends every line with a newline; pdfplumber, whose
+                # output the paragraph and heading heuristics were written
+                # for, does not end the last one
+                text = page.get_text("text").rstrip("\n")
+                pages.append(self._build_page_result(page_num, text))
+            return pages
+        finally:
+            doc.close()
+
+    def _try_pdftotext(self, file_path: str) -> Optional[List[str]]:
+        """
+        Extract per-page text with poppler's pdftotext binary.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Returns:
+            List of page texts, or None if pdftotext is unavailable or fails
+        """
+        if _PDFTOTEXT is None:
+            return None
+
+        try:
+            completed = subprocess.run(
+                [_PDFTOTEXT, "-enc", "UTF-8", file_path, "-"],
+                capture_output=True,
+                timeout=_PDFTOTEXT_TIMEOUT,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug(f"pdftotext failed for {file_path}: {str(e)}")
+            return None
+
+        if completed.returncode != 0:
+            logger.debug(
+                f"pdftotext exited with {completed.returncode} for {file_path}"
+            )
+            return None
+
+        # Every page ends with a form feed, so the last split item is empty
+        page_texts = completed.stdout.decode("utf-8", errors="replace").split("\f")
+        if page_texts and not page_texts[-1]:
+            page_texts.pop()
+        return [text.strip("\n") for text in page_texts]
+
+    def _parse_with_pdfplumber(self, file_path: str) -> List[PageResult]:
+        """
+        Extract pages with pdfplumber.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Returns:
+            List of PageResult objects
+        """
+        # Imported here: pdfplumber pulls in pdfminer and Pillow, which the
+        # PyMuPDF and pdftotext backends never need
+        import pdfplumber
+
+        with pdfplumber.open(file_path) as pdf:
+            page_count = len(pdf.pages)
+
+            if self.use_processes and page_count >= _PROCESS_POOL_MIN_PAGES:
+                page_texts = self._extract_pages_in_workers(file_path, page_count)
+                if page_texts is not None:
+                    return [
+                        self._build_page_result(page_num, text)
+                        for page_num, text in enumerate(page_texts, 1)
+                    ]
+
+            pages = []
+
+            for page_num, page in enumerate(pdf.pages, 1):
+                logger.debug("Processing page %s", page_num)
+
+                # Extract text; pdfplumber's default of laparams=None keeps
+                # pdfminer's layout analysis off for text-only extraction
+                text = page.extract_text() or ""
+
+                # Drop the page's cached chars and layout objects, which
+                # would otherwise be held until the whole PDF is closed
+                page.close()
+
+                pages.append(self._build_page_result(page_num, text))
+
+            return pages
+
+    def _extract_pages_in_workers(
+        self, file_path: str, page_count: int
+    ) -> Optional[List[str]]:
+        """
+        Extract page texts with pdfplumber across a pool of worker processes.
+
+        Args:
+            file_path: Path to the PDF file
+            page_count: Number of pages in the PDF
+
+        Returns:
+            List of page texts in page order, or None if the pool failed
+            or is not safe to start from the calling thread or process
+        """
+        if (
+            threading.current_thread() is not threading.main_thread()
+            or parent_process() is not None
+        ):
+            return None
+
+        workers = min(_PROCESS_POOL_MAX_WORKERS, os.cpu_count() or 1)
+        if workers < 2:
+            return None
+
+        # One contiguous range per worker, so each process opens the file once
+        step = -(-page_count // workers)
+        bounds = [
+            (start, min(start + step, page_count + 1))
+            for start in range(1, page_count + 1, step)
+        ]
+
+        try:
+            with ProcessPoolExecutor(max_workers=len(bounds)) as executor:
+                futures = [
+                    executor.submit(_extract_page_range, file_path, start, stop)
+                    for start, stop in bounds
+                ]
+                page_texts = []
+                for future in futures:
+                    page_texts.extend(future.result())
+        except Exception as e:
+            logger.warning(
+                f"Process pool unavailable, extracting pages in-process: {str(e)}"
+            )
+            return None
+
+        logger.debug(f"Extracted {page_count} pages in {len(bounds)} workers")
+        return page_texts
+
+    def _build_page_result(self, page_num: int, text: str) -> PageResult:
+        """
+        Build the PageResult for one page of extracted text.
+
+        Args:
+            page_num: 1-based page number
+            text: Text extracted from the page
+
+        Returns:
+            PageResult object
+        """
+        # Image-only (e.g. scanned) pages have no text; skip the heuristics
+        # and keep an empty page so numbering stays aligned for OCR callers
+        if not text or text.isspace():
+            logger.debug("Page %s has no extractable text", page_num)
+            return PageResult(
+                page_number=page_num,
+                content=PageContent(text="", paragraphs=[], headings=[]),
+                metadata=PageMetadata(word_count=0, char_count=0),
+            )
+
+        # Extract paragraphs (split by double newlines)
+        paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
+
+        # Extract headings (basic heuristic - lines that are short and in caps)
+        headings = self._extract_headings(text)
+
+        # Create page content
+        content = PageContent(text=text, paragraphs=paragraphs, headings=headings)
+
+        # Calculate metadata
+        metadata = self._calculate_metadata(text)
+
+        # Create page result
+        return PageResult(page_number=page_num, content=content, metadata=metadata)
+
     def _extract_headings(self, text: str) -> List[HeadingInfo]:
         """
         Extract headings from text using basic heuristics.
@@ -92,31 +324,26 @@ class PDFParser(BaseParser):
             List of HeadingInfo objects
         """
         headings = []
-        lines = text.split("\n")
 
-        for line in lines:
+        for line in text.split("\n"):
             line = line.strip()
 
             # Basic heuristic: short lines (< 80 chars) that are mostly uppercase
             # or start with common heading patterns
-            if (
-                line
-                and len(line) < 80
-                and (
-                    line.isupper()
-                    or any(
-                        line.startswith(pattern)
-                        for pattern in ["Chapter", "Section", "1.", "2.", "3."]
-                    )
-                )
-            ):
-                # Determine heading level based on content
+            if not line or len(line) >= 80:
+                continue
+            prefix = _HEADING_PREFIX_RE.match(line)
+            if not prefix and not line.isupper():
+                continue
+
+            # Determine heading level based on content
+            if prefix and prefix.group("num"):
+                level = 2
+            elif "section" in line.lower():
+                level = 3
+            else:
                 level = 1
-                if any(line.startswith(pattern) for pattern in ["1.", "2.", "3."]):
-                    level = 2
-                elif "section" in line.lower():
-                    level = 3
 
-                headings.append(HeadingInfo(level=level, text=line))
+            headings.append(HeadingInfo(level=level, text=line))
 
         return headings
@@ -11,7 +11,28 @@ from .exceptions import (
     InvalidConfigurationError,
 )
 from .logging import setup_logger, logger
-from .templates import TemplateProcessor, TEMPLATE_EXAMPLES
+from .cache import get_cache_dir, get_or_parse
+
+# The templates module imports Jinja2 and compiles the examples, so it is
+# only imported when one of its names is accessed
+_TEMPLATE_NAMES = (
+    "TemplateProcessor",
+    "TEMPLATE_EXAMPLES",
+    "COMPILED_TEMPLATE_EXAMPLES",
+    "STRUCTURED_TEMPLATE_EXAMPLES",
+)
+
+
+def __getattr__(name: str):
+    """Import template utilities on first access."""
+    if name not in _TEMPLATE_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import templates
+
+    value = getattr(templates, name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "DocumentParsingError",
@@ -22,6 +43,10 @@ __all__ = [
     "InvalidConfigurationError",
     "setup_logger",
     "logger",
+    "get_cache_dir",
+    "get_or_parse",
     "TemplateProcessor",
     "TEMPLATE_EXAMPLES",
+    "COMPILED_TEMPLATE_EXAMPLES",
+    "STRUCTURED_TEMPLATE_EXAMPLES",
 ]
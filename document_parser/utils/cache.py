@@ -0,0 +1,190 @@
+"""
+On-disk cache of parsed documents.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+from ..core.models import DocumentResult
+from ..utils.logging import logger
+
+if TYPE_CHECKING:
+    from ..core.parser import DocumentParser
+
+
+def get_cache_dir(name: str) -> str:
+    """
+    Get a per-user cache directory for the document parser.
+
+    The directory lives under $XDG_CACHE_HOME (or ~/.cache) and is created
+    with owner-only permissions, since cached files are loaded back
+    without further validation.
+
+    Args:
+        name: Subdirectory name for the cache
+
+    Returns:
+        Path to the cache directory
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    cache_dir = os.path.join(base, "document_parser", name)
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    return cache_dir
+
+
+# Bump whenever parser output changes, so results cached by an older
+# parser are not served
+_CACHE_SCHEMA_VERSION = 1
+
+
+# Optional modules whose presence switches a parser to another backend
+_BACKEND_MODULES = ("pymupdf", "pyarrow", "python_calamine")
+
+
+@lru_cache(maxsize=None)
+def _active_backends() -> str:
+    """
+    Describe which optional parsing backends are available.
+
+    Backends produce slightly different output, so results cached before
+    one was installed or removed must not be reused. Modules are only
+    looked up, not imported.
+
+    Returns:
+        Comma-separated names of the available backends
+    """
+    names = [name for name in _BACKEND_MODULES if find_spec(name) is not None]
+    if shutil.which("pdftotext"):
+        names.append("pdftotext")
+    return ",".join(names)
+
+
+def _path_key(file_path: str) -> str:
+    """
+    Build the part of a cache key shared by every version of a file.
+
+    Args:
+        file_path: Path to the document file
+
+    Returns:
+        Hex digest identifying the file's absolute path
+    """
+    raw = os.path.abspath(file_path)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=10).hexdigest()
+
+
+def _cache_key(file_path: str, file_stats: os.stat_result) -> str:
+    """
+    Build the cache key for a file from its path, mtime, size and the
+    available parsing backends.
+
+    Keys start with the file's path key, so older entries for the same
+    file can be found and pruned.
+
+    Args:
+        file_path: Path to the document file
+        file_stats: Result of os.stat for the file
+
+    Returns:
+        Hex digest identifying this version of the file
+    """
+    from .. import __version__
+
+    raw = (
+        f"{_CACHE_SCHEMA_VERSION}|{__version__}|{_active_backends()}|"
+        f"{os.path.abspath(file_path)}|"
+        f"{file_stats.st_mtime_ns}|{file_stats.st_size}"
+    )
+    version_key = hashlib.blake2b(raw.encode("utf-8"), digest_size=20).hexdigest()
+    return f"{_path_key(file_path)}-{version_key}"
+
+
+def _prune_entries(cache_path: str) -> None:
+    """
+    Remove other cache entries for the file a new entry was written for.
+
+    Args:
+        cache_path: Path of the entry just written
+    """
+    cache_dir, entry_name = os.path.split(cache_path)
+    prefix = entry_name.split("-", 1)[0] + "-"
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.name != entry_name:
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
+    except OSError as e:
+        logger.warning(f"Could not prune parse cache entries: {str(e)}")
+
+
+def get_or_parse(parser: "DocumentParser", file_path: str) -> DocumentResult:
+    """
+    Return the cached parse result for a file, parsing it on a cache miss.
+
+    Entries are keyed by the file's absolute path, modification time and
+    size, by _CACHE_SCHEMA_VERSION and by the available parsing backends,
+    so editing the file, upgrading the parser or installing a backend
+    invalidates its entry. Writing a new entry removes the stale
+    ones for the same file. A cached result keeps the created_at
+    timestamp of the original parse.
+
+    Args:
+        parser: DocumentParser used on a cache miss
+        file_path: Path to the document file
+
+    Returns:
+        DocumentResult for the file
+    """
+    try:
+        file_stats = os.stat(file_path)
+        cache_path = os.path.join(
+            get_cache_dir("parsed"), _cache_key(file_path, file_stats) + ".pkl"
+        )
+    except OSError:
+        # Missing file or unusable cache dir: let parse_file report errors
+        return parser.parse_file(file_path)
+
+    try:
+        with open(cache_path, "rb") as f:
+            result = pickle.load(f)
+        logger.debug(f"Loaded cached parse result for: {file_path}")
+        return result
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable parse cache entry: {str(e)}")
+
+    result = parser.parse_file(file_path)
+
+    try:
+        # Write to a temporary file first so readers never see partial data
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path))
+    except OSError as e:
+        logger.warning(f"Could not write parse cache entry: {str(e)}")
+        return result
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(result, f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not write parse cache entry: {str(e)}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        return result
+
+    _prune_entries(cache_path)
+    return result
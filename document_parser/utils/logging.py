@@ -26,6 +26,10 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
+    # Records are emitted by the handlers below; passing them on to the root
+    # logger as well would format and emit each one twice
+    logger.propagate = False
+
     # Avoid adding handlers multiple times
     if logger.handlers:
         return logger
@@ -2,15 +2,250 @@
 Template processing utilities using Jinja2.
 """
 
+import json
 import os
-from typing import Dict, Any, Optional, List
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
-
-from ..core.models import DocumentResult
+import uuid
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    AbstractSet,
+    Dict,
+    Any,
+    FrozenSet,
+    Iterable,
+    Optional,
+    List,
+    Tuple,
+)
+from weakref import WeakKeyDictionary
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    TemplateNotFound,
+    meta,
+    nodes,
+)
+
+from ..core.models import DocumentResult, HeadingInfo, PageResult
+from ..utils.cache import get_cache_dir
 from ..utils.exceptions import InvalidConfigurationError
 from ..utils.logging import logger
 
 
+# Flags for creating a fresh temporary output file; the kernel applies the
+# process umask to its 0o666 mode, as open() would
+_TEMP_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+# Shared Jinja2 environments keyed by template directory (None for strings)
+_ENV_CACHE: Dict[Optional[str], Environment] = {}
+
+# Shared TemplateProcessor instances keyed by template directory
+_PROCESSOR_CACHE: Dict[Optional[str], "TemplateProcessor"] = {}
+
+
+def _get_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """
+    Create the on-disk bytecode cache for file-based templates.
+
+    Compiled bytecode is kept in the per-user cache directory so it
+    survives process restarts without being shared with other users.
+
+    Returns:
+        FileSystemBytecodeCache instance, or None if the cache directory
+        cannot be created
+    """
+    try:
+        cache_dir = get_cache_dir("jinja_bytecode")
+    except OSError as e:
+        logger.warning(f"Template bytecode cache disabled: {str(e)}")
+        return None
+    return FileSystemBytecodeCache(directory=cache_dir, pattern="%s.cache")
+
+
+def _get_environment(template_dir: Optional[str]) -> Environment:
+    """
+    Get the shared Jinja2 environment for a template directory.
+
+    Environments are created once per process and reused across
+    TemplateProcessor instances. Since auto_reload is disabled, edits to
+    template files are only picked up after a process restart. File-based
+    environments also persist compiled bytecode in the user cache dir.
+
+    Args:
+        template_dir: Directory containing template files, or None
+
+    Returns:
+        Jinja2 Environment instance
+    """
+    env = _ENV_CACHE.get(template_dir)
+    if env is None:
+        loader = None
+        bytecode_cache = None
+        if template_dir:
+            loader = FileSystemLoader(template_dir)
+            bytecode_cache = _get_bytecode_cache()
+        env = Environment(
+            loader=loader,
+            bytecode_cache=bytecode_cache,
+            autoescape=True,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False,
+            cache_size=400,
+        )
+        _ENV_CACHE[template_dir] = env
+    return env
+
+
+def _get_template_processor(template_dir: Optional[str]) -> "TemplateProcessor":
+    """
+    Get the shared TemplateProcessor for a template directory.
+
+    Processors for a missing directory are not cached, so a directory
+    created later is still picked up by new DocumentParser instances.
+
+    Args:
+        template_dir: Directory containing template files, or None
+
+    Returns:
+        TemplateProcessor instance
+    """
+    processor = _PROCESSOR_CACHE.get(template_dir)
+    if processor is None:
+        processor = TemplateProcessor(template_dir)
+        if not template_dir or processor._env.loader is not None:
+            _PROCESSOR_CACHE[template_dir] = processor
+    return processor
+
+
+# File extensions loaded when a template directory is precompiled
+_PRECOMPILE_EXTENSIONS = ("j2", "jinja", "jinja2")
+
+# Context names each string template reads; templates without an entry,
+# or with None, get the full context
+_TEMPLATE_NAMES: "WeakKeyDictionary[Template, Optional[FrozenSet[str]]]" = (
+    WeakKeyDictionary()
+)
+
+# Context keys derived from a scan over every page
+_PAGE_AGGREGATES = frozenset(
+    {
+        "pages_dict",
+        "total_words",
+        "total_chars",
+        "all_text",
+        "all_paragraphs",
+        "all_headings",
+    }
+)
+
+
+def _referenced_names(env: Environment, source: str) -> Optional[FrozenSet[str]]:
+    """
+    Find the context variables a template source reads.
+
+    Args:
+        env: Jinja2 environment the template belongs to
+        source: Jinja2 template source
+
+    Returns:
+        Set of variable names, or None if the template pulls in other
+        templates whose variables cannot be seen from this source
+    """
+    ast = env.parse(source)
+    includes = (nodes.Extends, nodes.Include, nodes.Import, nodes.FromImport)
+    if any(ast.find_all(includes)):
+        return None
+    return frozenset(meta.find_undeclared_variables(ast))
+
+
+def _register_template(env: Environment, template: Template, source: str) -> Template:
+    """
+    Record which context variables a compiled template reads.
+
+    Args:
+        env: Jinja2 environment the template belongs to
+        template: Compiled template
+        source: Source the template was compiled from
+
+    Returns:
+        The same template, for chaining
+    """
+    _TEMPLATE_NAMES[template] = _referenced_names(env, source)
+    return template
+
+
+def _create_temp_file(path: Path) -> Tuple[int, str]:
+    """
+    Create a new, uniquely named temporary file beside an output path.
+
+    Args:
+        path: Output path the temporary file will replace
+
+    Returns:
+        Tuple of the open file descriptor and the temporary file's path
+
+    Raises:
+        FileNotFoundError: If the output directory does not exist
+    """
+    while True:
+        temp_path = str(path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            return os.open(temp_path, _TEMP_FILE_FLAGS, 0o666), temp_path
+        except FileExistsError:
+            continue
+
+
+def _bucket_headings(pages: List[PageResult]) -> Dict[int, List[HeadingInfo]]:
+    """
+    Group the headings of all pages by level, in document order.
+
+    Args:
+        pages: Page results of the document
+
+    Returns:
+        Dictionary mapping heading level to its headings
+    """
+    buckets: Dict[int, List[HeadingInfo]] = defaultdict(list)
+    for page in pages:
+        for heading in page.content.headings:
+            buckets[heading.level].append(heading)
+    return buckets
+
+
+def _sort_by_word_count(pages: List[PageResult]) -> Tuple[List[int], List[int]]:
+    """
+    Order page indexes by word count for range lookups with bisect.
+
+    Args:
+        pages: Page results of the document
+
+    Returns:
+        Tuple of sorted word counts and the page indexes in the same order
+    """
+    order = sorted(range(len(pages)), key=lambda i: pages[i].metadata.word_count)
+    return [pages[i].metadata.word_count for i in order], order
+
+
+@lru_cache(maxsize=256)
+def _compile_template(env: Environment, template_string: str) -> Template:
+    """
+    Compile a template string, reusing the result for identical sources.
+
+    Args:
+        env: Jinja2 environment the template belongs to
+        template_string: Jinja2 template source
+
+    Returns:
+        Compiled Template object
+    """
+    return _register_template(env, env.from_string(template_string), template_string)
+
+
 class TemplateProcessor:
     """
     Process document parsing results with Jinja2 templates.
@@ -27,27 +262,21 @@ class TemplateProcessor:
             template_dir: Directory containing template files (optional)
         """
         self.template_dir = template_dir
-        self._env = None
-        self._setup_environment()
+        self._env: Environment = self._setup_environment()
         logger.info("TemplateProcessor initialized")
 
-    def _setup_environment(self) -> None:
+    def _setup_environment(self) -> Environment:
         """Set up Jinja2 environment."""
         if self.template_dir and os.path.exists(self.template_dir):
             # Use FileSystemLoader if template directory exists
-            loader = FileSystemLoader(self.template_dir)
-            self._env = Environment(
-                loader=loader, autoescape=True, trim_blocks=True, lstrip_blocks=True
-            )
             logger.info(
                 f"Template environment setup with directory: {self.template_dir}"
             )
-        else:
-            # Use default environment for string templates
-            self._env = Environment(
-                autoescape=True, trim_blocks=True, lstrip_blocks=True
-            )
-            logger.info("Template environment setup for string templates")
+            return _get_environment(self.template_dir)
+
+        # Use default environment for string templates
+        logger.info("Template environment setup for string templates")
+        return _get_environment(None)
 
     def render_from_string(
         self,
@@ -70,8 +299,38 @@ class TemplateProcessor:
             InvalidConfigurationError: If template rendering fails
         """
         try:
-            template = self._env.from_string(template_string)
-            context = self._build_context(document_result, extra_context)
+            template = _compile_template(self._env, template_string)
+            context = self._build_context(
+                document_result, extra_context, _TEMPLATE_NAMES.get(template)
+            )
+
+            logger.debug("Rendering template from string")
+            rendered = template.render(**context)
+            logger.info("Template rendered successfully from string")
+
+            return rendered
+
+        except Exception as e:
+            raise InvalidConfigurationError(
+                f"Failed to render template from string: {str(e)}"
+            )
+
+    def _render_string(self, template_string: str, context: Dict[str, Any]) -> str:
+        """
+        Render a template string with an already built context.
+
+        Args:
+            template_string: Jinja2 template as string
+            context: Context from _build_context
+
+        Returns:
+            Rendered template string
+
+        Raises:
+            InvalidConfigurationError: If template rendering fails
+        """
+        try:
+            template = _compile_template(self._env, template_string)
 
             logger.debug("Rendering template from string")
             rendered = template.render(**context)
@@ -84,6 +343,163 @@ class TemplateProcessor:
                 f"Failed to render template from string: {str(e)}"
             )
 
+    def render_compiled(
+        self,
+        template: Template,
+        document_result: DocumentResult,
+        extra_context: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Render an already compiled template with document data.
+
+        Args:
+            template: Compiled Jinja2 template
+            document_result: Parsed document result
+            extra_context: Additional context variables
+
+        Returns:
+            Rendered template string
+
+        Raises:
+            InvalidConfigurationError: If template rendering fails
+        """
+        try:
+            context = self._build_context(
+                document_result, extra_context, _TEMPLATE_NAMES.get(template)
+            )
+
+            logger.debug("Rendering compiled template")
+            rendered = template.render(**context)
+            logger.info("Compiled template rendered successfully")
+
+            return rendered
+
+        except Exception as e:
+            raise InvalidConfigurationError(
+                f"Failed to render compiled template: {str(e)}"
+            )
+
+    def render_example(
+        self,
+        name: str,
+        document_result: DocumentResult,
+        extra_context: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Render one of the built-in template examples with document data.
+
+        Args:
+            name: Key of the example in TEMPLATE_EXAMPLES
+            document_result: Parsed document result
+            extra_context: Additional context variables
+
+        Returns:
+            Rendered template string
+
+        Raises:
+            InvalidConfigurationError: If the example is unknown or fails to render
+        """
+        template = COMPILED_TEMPLATE_EXAMPLES.get(name)
+        if template is None:
+            raise InvalidConfigurationError(f"Template example '{name}' not found")
+        return self.render_compiled(template, document_result, extra_context)
+
+    def render_example_data(
+        self,
+        name: str,
+        document_result: DocumentResult,
+        extra_context: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Render a structured template example and parse its output.
+
+        The example renders as JSON text and is decoded with json.loads,
+        which, unlike a native environment's literal_eval, decodes the
+        surrogate-pair escapes tojson writes for non-BMP characters.
+
+        Args:
+            name: Key of the example in STRUCTURED_TEMPLATE_EXAMPLES
+            document_result: Parsed document result
+            extra_context: Additional context variables
+
+        Returns:
+            Python data the example describes
+
+        Raises:
+            InvalidConfigurationError: If the example is unknown, not
+                structured, or fails to render
+        """
+        if name not in STRUCTURED_TEMPLATE_EXAMPLES:
+            raise InvalidConfigurationError(
+                f"Template example '{name}' does not render structured data"
+            )
+        rendered = self.render_example(name, document_result, extra_context)
+        try:
+            return json.loads(rendered)
+        except ValueError as e:
+            raise InvalidConfigurationError(
+                f"Template example '{name}' rendered invalid JSON: {str(e)}"
+            )
+
+    def get_template(self, template_filename: str) -> Template:
+        """
+        Load a template file from the template directory.
+
+        Args:
+            template_filename: Name of template file
+
+        Returns:
+            Compiled Jinja2 template
+
+        Raises:
+            InvalidConfigurationError: If template file not found or invalid
+        """
+        if not self.template_dir:
+            raise InvalidConfigurationError(
+                "Template directory not configured for file-based templates"
+            )
+
+        try:
+            template = self._env.get_template(template_filename)
+        except TemplateNotFound:
+            raise InvalidConfigurationError(
+                f"Template file not found: {template_filename}"
+            )
+        except Exception as e:
+            raise InvalidConfigurationError(
+                f"Failed to load template file '{template_filename}': {str(e)}"
+            )
+
+        # File templates are not re-parsed to find the names they read,
+        # which would undo the bytecode cache; they get the full context
+        return template
+
+    def precompile_templates(self) -> int:
+        """
+        Load every template in the template directory ahead of first use.
+
+        Templates that fail to load are logged and skipped, so the error
+        is raised again when the template is actually rendered.
+
+        Returns:
+            Number of templates loaded
+        """
+        if not self.template_dir or self._env.loader is None:
+            return 0
+
+        loaded = 0
+        for template_filename in self._env.list_templates(
+            extensions=_PRECOMPILE_EXTENSIONS
+        ):
+            try:
+                self.get_template(template_filename)
+                loaded += 1
+            except InvalidConfigurationError as e:
+                logger.warning(f"Skipping template during precompile: {str(e)}")
+
+        logger.debug(f"Precompiled {loaded} templates from {self.template_dir}")
+        return loaded
+
     def render_from_file(
         self,
         template_filename: str,
@@ -104,15 +520,55 @@ class TemplateProcessor:
         Raises:
             InvalidConfigurationError: If template file not found or rendering fails
         """
-        if not self.template_dir:
+        template = self.get_template(template_filename)
+
+        try:
+            context = self._build_context(
+                document_result, extra_context, _TEMPLATE_NAMES.get(template)
+            )
+        except Exception as e:
             raise InvalidConfigurationError(
-                "Template directory not configured for file-based templates"
+                f"Failed to render template from file '{template_filename}': {str(e)}"
             )
 
-        try:
-            template = self._env.get_template(template_filename)
-            context = self._build_context(document_result, extra_context)
+        return self._render_template(template, template_filename, context)
+
+    def _render_file(self, template_filename: str, context: Dict[str, Any]) -> str:
+        """
+        Render a template file with an already built context.
+
+        Args:
+            template_filename: Name of template file
+            context: Context from _build_context
+
+        Returns:
+            Rendered template string
+
+        Raises:
+            InvalidConfigurationError: If template file not found or rendering fails
+        """
+        return self._render_template(
+            self.get_template(template_filename), template_filename, context
+        )
+
+    def _render_template(
+        self, template: Template, template_filename: str, context: Dict[str, Any]
+    ) -> str:
+        """
+        Render a loaded template file with an already built context.
 
+        Args:
+            template: Template loaded by get_template
+            template_filename: Name of template file, for logs and errors
+            context: Context from _build_context
+
+        Returns:
+            Rendered template string
+
+        Raises:
+            InvalidConfigurationError: If template rendering fails
+        """
+        try:
             logger.debug(f"Rendering template from file: {template_filename}")
             rendered = template.render(**context)
             logger.info(
@@ -121,15 +577,78 @@ class TemplateProcessor:
 
             return rendered
 
-        except TemplateNotFound:
+        except Exception as e:
             raise InvalidConfigurationError(
-                f"Template file not found: {template_filename}"
+                f"Failed to render template from file '{template_filename}': {str(e)}"
             )
+
+    def render_many(
+        self,
+        template_string: str,
+        document_results: Iterable[DocumentResult],
+        extra_context: Optional[Dict[str, Any]] = None,
+    ) -> List[str]:
+        """
+        Render one template string for each of many documents.
+
+        Args:
+            template_string: Jinja2 template as string
+            document_results: Parsed document results
+            extra_context: Additional context variables shared by every render
+
+        Returns:
+            Rendered template strings, one per document in input order
+
+        Raises:
+            InvalidConfigurationError: If template compilation or rendering fails
+        """
+        try:
+            template = _compile_template(self._env, template_string)
         except Exception as e:
             raise InvalidConfigurationError(
-                f"Failed to render template from file '{template_filename}': {str(e)}"
+                f"Failed to render template from string: {str(e)}"
             )
 
+        return [
+            self.render_compiled(template, document_result, extra_context)
+            for document_result in document_results
+        ]
+
+    def render_file_many(
+        self,
+        template_filename: str,
+        document_results: Iterable[DocumentResult],
+        extra_context: Optional[Dict[str, Any]] = None,
+    ) -> List[str]:
+        """
+        Render one template file for each of many documents.
+
+        Args:
+            template_filename: Name of template file
+            document_results: Parsed document results
+            extra_context: Additional context variables shared by every render
+
+        Returns:
+            Rendered template strings, one per document in input order
+
+        Raises:
+            InvalidConfigurationError: If template file not found or rendering fails
+        """
+        template = self.get_template(template_filename)
+        names = _TEMPLATE_NAMES.get(template)
+
+        results = []
+        for document_result in document_results:
+            try:
+                context = self._build_context(document_result, extra_context, names)
+            except Exception as e:
+                raise InvalidConfigurationError(
+                    f"Failed to render template from file '{template_filename}': "
+                    f"{str(e)}"
+                )
+            results.append(self._render_template(template, template_filename, context))
+        return results
+
     def render_multiple(
         self,
         templates: List[Dict[str, Any]],
@@ -155,20 +674,39 @@ class TemplateProcessor:
         """
         results = {}
 
+        # The page aggregates in the context are the same for every template,
+        # so they are built once, on the first template that needs them
+        context = None
+
+        # Entries repeating a source render to the same output with the
+        # shared context, so each distinct source is rendered only once
+        rendered_by_source: Dict[Tuple[str, str], str] = {}
+
         for template_def in templates:
             template_name = template_def.get("name")
             if not template_name:
                 logger.warning("Template definition missing 'name', skipping")
                 continue
 
+            if "string" in template_def:
+                source_key = ("string", template_def["string"])
+            else:
+                source_key = ("file", template_def.get("file"))
+            if source_key in rendered_by_source:
+                results[template_name] = rendered_by_source[source_key]
+                continue
+
             try:
                 if "string" in template_def:
-                    rendered = self.render_from_string(
-                        template_def["string"], document_result, extra_context
-                    )
+                    if context is None:
+                        context = self._build_context(document_result, extra_context)
+                    rendered = self._render_string(template_def["string"], context)
                 elif "file" in template_def:
-                    rendered = self.render_from_file(
-                        template_def["file"], document_result, extra_context
+                    template = self.get_template(template_def["file"])
+                    if context is None:
+                        context = self._build_context(document_result, extra_context)
+                    rendered = self._render_template(
+                        template, template_def["file"], context
                     )
                 else:
                     logger.warning(
@@ -176,7 +714,7 @@ class TemplateProcessor:
                     )
                     continue
 
-                results[template_name] = rendered
+                results[template_name] = rendered_by_source[source_key] = rendered
 
             except Exception as e:
                 logger.error(f"Failed to render template '{template_name}': {str(e)}")
@@ -188,6 +726,7 @@ class TemplateProcessor:
         self,
         document_result: DocumentResult,
         extra_context: Optional[Dict[str, Any]] = None,
+        names: Optional[AbstractSet[str]] = None,
     ) -> Dict[str, Any]:
         """
         Build template context from document result and extra context.
@@ -195,39 +734,45 @@ class TemplateProcessor:
         Args:
             document_result: Parsed document result
             extra_context: Additional context variables
+            names: Variables the template reads; page aggregates it never
+                reads are left out. None builds the full context.
 
         Returns:
             Complete context dictionary for template rendering
         """
+        pages = document_result.pages
+
         # Convert document result to dictionary
         context = {
             "document_info": document_result.document_info,  # Keep as object for easier access
-            "document": document_result.document_info.to_dict(),  # Dictionary version for compatibility
-            "pages": document_result.pages,  # Keep as objects for easier access
-            "pages_dict": [
-                page.to_dict() for page in document_result.pages
-            ],  # Dictionary version
-            "total_pages": len(document_result.pages),
-            "total_words": sum(
-                page.metadata.word_count for page in document_result.pages
-            ),
-            "total_chars": sum(
-                page.metadata.char_count for page in document_result.pages
-            ),
-            "all_text": "\n\n".join(
-                page.content.text for page in document_result.pages
-            ),
-            "all_paragraphs": [
-                para
-                for page in document_result.pages
-                for para in page.content.paragraphs
-            ],
-            "all_headings": [
-                heading
-                for page in document_result.pages
-                for heading in page.content.headings
-            ],
+            "pages": pages,  # Keep as objects for easier access
+            "total_pages": len(pages),
         }
+        if names is None or "document" in names:
+            # Dictionary version for compatibility
+            context["document"] = document_result.document_info.to_dict()
+
+        wanted = _PAGE_AGGREGATES if names is None else _PAGE_AGGREGATES & names
+        if wanted:
+            context.update(self._page_aggregates(pages, wanted))
+
+        # Lookup indexes for the helpers, built on first use and then shared
+        # by every call the template makes
+        indexes: Dict[str, Any] = {}
+
+        def get_headings_by_level(level: int) -> List[HeadingInfo]:
+            if "headings" not in indexes:
+                indexes["headings"] = _bucket_headings(pages)
+            return list(indexes["headings"].get(level, ()))
+
+        def word_count_range(min_words: int, max_words: int) -> List[PageResult]:
+            if "word_counts" not in indexes:
+                indexes["word_counts"] = _sort_by_word_count(pages)
+            counts, order = indexes["word_counts"]
+            matches = order[
+                bisect_left(counts, min_words) : bisect_right(counts, max_words)
+            ]
+            return [pages[i] for i in sorted(matches)]
 
         # Add helper functions to context
         context.update(
@@ -235,17 +780,8 @@ class TemplateProcessor:
                 "get_page": lambda n: document_result.pages[n - 1]
                 if 1 <= n <= len(document_result.pages)
                 else None,
-                "get_headings_by_level": lambda level: [
-                    h
-                    for page in document_result.pages
-                    for h in page.content.headings
-                    if h.level == level
-                ],
-                "word_count_range": lambda min_words, max_words: [
-                    page
-                    for page in document_result.pages
-                    if min_words <= page.metadata.word_count <= max_words
-                ],
+                "get_headings_by_level": get_headings_by_level,
+                "word_count_range": word_count_range,
             }
         )
 
@@ -255,6 +791,53 @@ class TemplateProcessor:
 
         return context
 
+    @staticmethod
+    def _page_aggregates(pages: List[Any], wanted: AbstractSet[str]) -> Dict[str, Any]:
+        """
+        Gather the requested page aggregates in a single pass over the pages.
+
+        Args:
+            pages: Page results of the document
+            wanted: Names from _PAGE_AGGREGATES to compute
+
+        Returns:
+            Dictionary with one entry per wanted aggregate
+        """
+        want_dicts = "pages_dict" in wanted
+        want_text = "all_text" in wanted
+        want_paragraphs = "all_paragraphs" in wanted
+        want_headings = "all_headings" in wanted
+
+        pages_dict = []
+        texts = []
+        all_paragraphs = []
+        all_headings = []
+        total_words = 0
+        total_chars = 0
+        for page in pages:
+            content = page.content
+            metadata = page.metadata
+            if want_dicts:
+                pages_dict.append(page.to_dict())
+            if want_text:
+                texts.append(content.text)
+            if want_paragraphs:
+                all_paragraphs.extend(content.paragraphs)
+            if want_headings:
+                all_headings.extend(content.headings)
+            total_words += metadata.word_count
+            total_chars += metadata.char_count
+
+        aggregates = {
+            "pages_dict": pages_dict,  # Dictionary version
+            "total_words": total_words,
+            "total_chars": total_chars,
+            "all_text": "\n\n".join(texts),
+            "all_paragraphs": all_paragraphs,
+            "all_headings": all_headings,
+        }
+        return {name: aggregates[name] for name in wanted}
+
     def save_rendered_template(
         self,
         template_string: str,
@@ -270,25 +853,47 @@ class TemplateProcessor:
             document_result: Parsed document result
             output_path: Path to save rendered output
             extra_context: Additional context variables
+
+        Raises:
+            InvalidConfigurationError: If template rendering fails
         """
-        rendered = self.render_from_string(
-            template_string, document_result, extra_context
-        )
+        try:
+            template = _compile_template(self._env, template_string)
+            context = self._build_context(
+                document_result, extra_context, _TEMPLATE_NAMES.get(template)
+            )
+        except Exception as e:
+            raise InvalidConfigurationError(
+                f"Failed to render template from string: {str(e)}"
+            )
 
-        # Ensure output directory exists
-        output_dir = os.path.dirname(output_path)
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
+        # Render into a temporary file beside the target and move it into
+        # place only on success, so a failed render never touches an
+        # existing file. The directory is created only if it is missing.
+        path = Path(output_path)
+        try:
+            fd, temp_path = _create_temp_file(path)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = _create_temp_file(path)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(rendered)
+        # Stream the output so the whole rendered text is never held at once
+        try:
+            with open(fd, "w", encoding="utf-8") as output_file:
+                output_file.writelines(template.generate(**context))
+            os.replace(temp_path, path)
+        except Exception as e:
+            os.unlink(temp_path)
+            raise InvalidConfigurationError(
+                f"Failed to render template from string: {str(e)}"
+            )
 
         logger.info(f"Rendered template saved to: {output_path}")
 
 
 # Pre-defined template examples
 TEMPLATE_EXAMPLES = {
-    "summary": """
+    "summary": """\
 Document Summary
 ================
 Filename: {{ document.filename }}
@@ -308,9 +913,8 @@ Table of Contents:
 {% if pages|length > 0 %}
 First Page Preview:
 {{ pages[0].content.text[:200] }}{% if pages[0].content.text|length > 200 %}...{% endif %}
-{% endif %}
-""".strip(),
-    "detailed_report": """
+{% endif %}""",
+    "detailed_report": """\
 # Document Analysis Report
 
 ## Document Information
@@ -351,13 +955,12 @@ First Page Preview:
 ```
 
 ---
-{% endfor %}
-""".strip(),
-    "json_summary": """
+{% endfor %}""",
+    "json_summary": """\
 {
   "summary": {
-    "filename": "{{ document.filename }}",
-    "type": "{{ document.file_type }}",
+    "filename": {{ document.filename|tojson }},
+    "type": {{ document.file_type|tojson }},
     "pages": {{ total_pages }},
     "words": {{ total_words }},
     "characters": {{ total_chars }},
@@ -367,7 +970,7 @@ First Page Preview:
     {% for heading in all_headings %}
     {
       "level": {{ heading.level }},
-      "text": "{{ heading.text|replace('"', '\\"') }}"
+      "text": {{ heading.text|tojson }}
     }{% if not loop.last %},{% endif %}
     {% endfor %}
   ],
@@ -380,6 +983,15 @@ First Page Preview:
     }{% if not loop.last %},{% endif %}
     {% endfor %}
   ]
+}""",
 }
-""".strip(),
+
+# Examples compiled once at import, so rendering them never recompiles
+COMPILED_TEMPLATE_EXAMPLES: Dict[str, Template] = {
+    name: _compile_template(_get_environment(None), source)
+    for name, source in TEMPLATE_EXAMPLES.items()
 }
+
+
+# Examples whose output is structured data rather than display text
+STRUCTURED_TEMPLATE_EXAMPLES = frozenset({"json_summary"})
@@ -1,14 +1,43 @@
+import os
 import sys
+import traceback
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+if __name__ == "__main__":
+    # Running as a script from a source checkout: make the package importable.
+    # Not needed when the package is installed (pip install -e .).
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from document_parser import DocumentParser
 
 parser = DocumentParser({"template_dir": "sample_files"})
 
+# Every report below is written here; create it once up front
+os.makedirs("output", exist_ok=True)
+
+# Template used to render the parsed sample PDF
+SIMPLE_TEMPLATE = """
+PDF Document Analysis
+=====================
+File: {{ document_info.filename }}
+Pages: {{ document_info.total_pages }}
+Total Words: {{ total_words }}
+Total Characters: {{ total_chars }}
+
+{% if all_headings %}
+Headings Found:
+{% for heading in all_headings[:5] %}
+  {{ loop.index }}. {{ heading.text }}
+{% endfor %}
+{% if all_headings|length > 5 %}
+  ... and {{ all_headings|length - 5 }} more headings
+{% endif %}
+{% endif %}
+
+First Page Preview:
+{{ pages[0].content.text[:300] if pages and pages[0].content.text else "No text content" }}...
+""".strip()
+
 # Method 1: Simple template string (easiest way)
 # print("\n1. Simple template string:")
 # result = parser.render_simple_template(
@@ -67,8 +96,6 @@ try:
     pdf_path = "sample_files/sample-local-pdf.pdf"
 
     # Check if file exists
-    import os
-
     if os.path.exists(pdf_path):
         print(f"✅ Found PDF file: {pdf_path}")
 
@@ -106,30 +133,8 @@ try:
 
         # Test rendering with a simple template
         print("\n🎨 Template Rendering Test:")
-        simple_template = """
-PDF Document Analysis
-=====================
-File: {{ document_info.filename }}
-Pages: {{ document_info.total_pages }}
-Total Words: {{ total_words }}
-Total Characters: {{ total_chars }}
-
-{% if all_headings %}
-Headings Found:
-{% for heading in all_headings[:5] %}
-  {{ loop.index }}. {{ heading.text }}
-{% endfor %}
-{% if all_headings|length > 5 %}
-  ... and {{ all_headings|length - 5 }} more headings
-{% endif %}
-{% endif %}
-
-First Page Preview:
-{{ pages[0].content.text[:300] if pages and pages[0].content.text else "No text content" }}...
-""".strip()
-
         rendered = parser.render_template(
-            simple_template,
+            SIMPLE_TEMPLATE,
             document_result,
             extra_context={"analysis_date": "2025-07-02"},
         )
@@ -138,9 +143,9 @@ First Page Preview:
         # Test with template file if document_summary.j2 exists
         print("\n📋 Testing with document_summary.j2 template:")
         try:
-            summary_result = parser.render_data_file_to_template(
-                pdf_path,
+            summary_result = parser.render_template_file(
                 "document_summary.j2",
+                document_result,
                 extra_context={
                     "processing_date": "2025-07-02",
                     "parser_version": "1.0.0",
@@ -150,7 +155,6 @@ First Page Preview:
 
             # Save the result to a file
             output_path = "output/pdf_summary_report.md"
-            os.makedirs("output", exist_ok=True)
             with open(output_path, "w", encoding="utf-8") as f:
                 f.write(summary_result)
 
@@ -169,8 +173,6 @@ First Page Preview:
 
 except Exception as e:
     print(f"❌ Error processing PDF: {e}")
-    import traceback
-
     traceback.print_exc()
 
 # Method 7: Test loading and parsing CSV file
@@ -179,8 +181,6 @@ try:
     csv_path = "sample_files/customers-100.csv"
 
     # Check if file exists
-    import os
-
     if os.path.exists(csv_path):
         print(f"✅ Found CSV file: {csv_path}")
 
@@ -222,8 +222,10 @@ try:
         # Test rendering with a CSV-specific template from file
         print("\n📊 CSV Template Rendering Test (using csv_report.j2):")
         try:
-            rendered = parser.render_data_file_to_template(
-                csv_path, "csv_report.j2", extra_context={"analysis_date": "2025-07-02"}
+            rendered = parser.render_template_file(
+                "csv_report.j2",
+                document_result,
+                extra_context={"analysis_date": "2025-07-02"},
             )
             print(rendered)
         except Exception as e:
@@ -232,9 +234,9 @@ try:
         # Test with document_summary.j2 template for CSV
         print("\n📋 Testing CSV with document_summary.j2 template:")
         try:
-            summary_result = parser.render_data_file_to_template(
-                csv_path,
+            summary_result = parser.render_template_file(
                 "document_summary.j2",
+                document_result,
                 extra_context={
                     "processing_date": "2025-07-02",
                     "parser_version": "1.0.0",
@@ -244,7 +246,6 @@ try:
 
             # Save the result to a file
             output_path = "output/csv_summary_report.md"
-            os.makedirs("output", exist_ok=True)
             with open(output_path, "w", encoding="utf-8") as f:
                 f.write(summary_result)
 
@@ -258,9 +259,9 @@ try:
         # Test creating a custom CSV report from template file
         print("\n📊 Creating custom CSV report (using csv_custom_report.j2):")
         try:
-            custom_result = parser.render_data_file_to_template(
-                csv_path,
+            custom_result = parser.render_template_file(
                 "csv_custom_report.j2",
+                document_result,
                 extra_context={
                     "processing_date": "2025-07-02",
                     "total_rows": first_section.metadata.word_count,
@@ -283,9 +284,9 @@ try:
         # Test with dedicated CSV template
         print("\n📊 Testing with dedicated csv_report.j2 template:")
         try:
-            csv_template_result = parser.render_data_file_to_template(
-                csv_path,
+            csv_template_result = parser.render_template_file(
                 "csv_report.j2",
+                document_result,
                 extra_context={
                     "processing_date": "2025-07-02",
                     "parser_version": "1.0.0",
@@ -312,6 +313,4 @@ try:
 
 except Exception as e:
     print(f"❌ Error processing CSV: {e}")
-    import traceback
-
     traceback.print_exc()
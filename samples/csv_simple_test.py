@@ -1,9 +1,10 @@
 import sys
 from pathlib import Path
 
-# Add parent directory (project root) to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if __name__ == "__main__":
+    # Running as a script from a source checkout: make the package importable.
+    # Not needed when the package is installed (pip install -e .).
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from document_parser import DocumentParser
 
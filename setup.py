@@ -2,15 +2,20 @@
 Setup configuration for the document parser package.
 """
 
+from pathlib import Path
+
 from setuptools import setup, find_packages
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+# Resolve files next to setup.py, so builds work from any directory
+here = Path(__file__).resolve().parent
+
+long_description = (here / "README.md").read_text(encoding="utf-8")
 
-with open("requirements.txt", "r", encoding="utf-8") as fh:
-    requirements = [
-        line.strip() for line in fh if line.strip() and not line.startswith("#")
-    ]
+requirements = [
+    line.strip()
+    for line in (here / "requirements.txt").read_text(encoding="utf-8").splitlines()
+    if line.strip() and not line.startswith("#")
+]
 
 setup(
     name="document-parser",
@@ -21,7 +26,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/document-parser",
-    packages=find_packages(),
+    packages=find_packages(include=["document_parser", "document_parser.*"]),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -38,6 +43,16 @@ setup(
     python_requires=">=3.8",
     install_requires=requirements,
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+            "pyarrow>=10.0.0",
+            "python-calamine>=0.1.7",
+        ],
+        # PyMuPDF is AGPL-3.0 licensed, unlike this MIT package, so it is
+        # kept out of "fast" and only installed on request
+        "pymupdf": [
+            "pymupdf>=1.24.3",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
@@ -6,11 +6,15 @@ import pytest
 import tempfile
 import os
 import sys
+from datetime import datetime
+from importlib.util import find_spec
 from pathlib import Path
 
-# Add project root to Python path for imports
+# Add project root to Python path for imports, unless the package is
+# already importable (installed with pip install -e . or run from the root)
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if find_spec("document_parser") is None:
+    sys.path.insert(0, str(project_root))
 
 
 @pytest.fixture
@@ -34,3 +38,19 @@ def sample_docx_path(temp_dir):
     docx_path = os.path.join(temp_dir, "sample.docx")
     # In real implementation, you'd create or copy a real DOCX file here
     return docx_path
+
+
+@pytest.fixture
+def empty_document_result():
+    """Create a DocumentResult for a page-less test.pdf."""
+    # Imported here so the project root is on sys.path first
+    from document_parser.core.models import DocumentInfo, DocumentResult
+
+    info = DocumentInfo(
+        filename="test.pdf",
+        file_type="pdf",
+        total_pages=0,
+        created_at=datetime.now(),
+        file_size=1000,
+    )
+    return DocumentResult(document_info=info, pages=[])
@@ -0,0 +1,107 @@
+"""
+Tests for the parsed-document cache.
+"""
+
+import os
+from unittest.mock import patch
+
+from document_parser.core.parser import DocumentParser
+from document_parser.utils.cache import get_cache_dir, get_or_parse
+
+
+class TestParseCache:
+    """Test cases for get_or_parse."""
+
+    def _write_csv(self, temp_dir, content):
+        csv_path = os.path.join(temp_dir, "data.csv")
+        with open(csv_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return csv_path
+
+    def test_cache_dir_is_private(self, temp_dir, monkeypatch):
+        """Test that the cache directory is created under XDG_CACHE_HOME."""
+        monkeypatch.setenv("XDG_CACHE_HOME", temp_dir)
+
+        cache_dir = get_cache_dir("parsed")
+
+        assert cache_dir.startswith(temp_dir)
+        assert os.path.isdir(cache_dir)
+        if os.name == "posix":
+            assert os.stat(cache_dir).st_mode & 0o777 == 0o700
+
+    def test_second_call_uses_cache(self, temp_dir, monkeypatch):
+        """Test that an unchanged file is only parsed once."""
+        monkeypatch.setenv("XDG_CACHE_HOME", temp_dir)
+        csv_path = self._write_csv(temp_dir, "Name,Age\nAlice,25\n")
+        parser = DocumentParser()
+
+        first = get_or_parse(parser, csv_path)
+        with patch.object(parser, "parse_file") as mock_parse:
+            second = get_or_parse(parser, csv_path)
+
+        mock_parse.assert_not_called()
+        assert second.to_dict() == first.to_dict()
+
+    def test_modified_file_is_reparsed(self, temp_dir, monkeypatch):
+        """Test that changing the file invalidates its cache entry."""
+        monkeypatch.setenv("XDG_CACHE_HOME", temp_dir)
+        csv_path = self._write_csv(temp_dir, "Name,Age\nAlice,25\n")
+        parser = DocumentParser()
+
+        get_or_parse(parser, csv_path)
+        self._write_csv(temp_dir, "Name,Age\nAlice,25\nBob,30\n")
+        result = get_or_parse(parser, csv_path)
+
+        assert "Bob" in result.pages[0].content.text
+
+    def test_modified_file_replaces_old_entry(self, temp_dir, monkeypatch):
+        """Test that writing a new entry prunes stale entries for the file."""
+        monkeypatch.setenv("XDG_CACHE_HOME", temp_dir)
+        csv_path = self._write_csv(temp_dir, "Name,Age\nAlice,25\n")
+        parser = DocumentParser()
+
+        get_or_parse(parser, csv_path)
+        self._write_csv(temp_dir, "Name,Age\nAlice,25\nBob,30\n")
+        get_or_parse(parser, csv_path)
+
+        assert len(os.listdir(get_cache_dir("parsed"))) == 1
+
+    def test_schema_version_invalidates_entries(self, temp_dir, monkeypatch):
+        """Test that bumping the cache schema version forces a reparse."""
+        from document_parser.utils import cache
+
+        monkeypatch.setenv("XDG_CACHE_HOME", temp_dir)
+        csv_path = self._write_csv(temp_dir, "Name,Age\nAlice,25\n")
+        parser = DocumentParser()
+
+        get_or_parse(parser, csv_path)
+        monkeypatch.setattr(cache, "_CACHE_SCHEMA_VERSION", 0)
+        with patch.object(parser, "parse_file", wraps=parser.parse_file) as parse:
+            get_or_parse(parser, csv_path)
+
+        parse.assert_called_once()
+
+    def test_backend_change_invalidates_entries(self, temp_dir, monkeypatch):
+        """Test that installing a parsing backend forces a reparse."""
+        from document_parser.utils import cache
+
+        monkeypatch.setenv("XDG_CACHE_HOME", temp_dir)
+        csv_path = self._write_csv(temp_dir, "Name,Age\nAlice,25\n")
+        parser = DocumentParser()
+
+        get_or_parse(parser, csv_path)
+        monkeypatch.setattr(cache, "_active_backends", lambda: "new-backend")
+        with patch.object(parser, "parse_file", wraps=parser.parse_file) as parse:
+            get_or_parse(parser, csv_path)
+
+        parse.assert_called_once()
+
+    def test_template_bytecode_cache_uses_cache_dir(self, temp_dir, monkeypatch):
+        """Test that template bytecode is cached in the per-user cache dir."""
+        from document_parser.utils.templates import _get_bytecode_cache
+
+        monkeypatch.setenv("XDG_CACHE_HOME", temp_dir)
+
+        bytecode_cache = _get_bytecode_cache()
+
+        assert bytecode_cache.directory == get_cache_dir("jinja_bytecode")
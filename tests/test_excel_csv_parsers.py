@@ -49,6 +49,24 @@ class TestExcelParser:
         assert "Sheet1" in results[0].content.text
         assert "Sheet2" in results[1].content.text
 
+    def test_parse_workbook_with_several_sheets(self, temp_dir):
+        """Test parsing every sheet of a real workbook opened once."""
+        pytest.importorskip("openpyxl")
+        file_path = os.path.join(temp_dir, "book.xlsx")
+        with pd.ExcelWriter(file_path) as writer:
+            pd.DataFrame({"A": [1, 2]}).to_excel(
+                writer, sheet_name="First", index=False
+            )
+            pd.DataFrame({"B": ["x"]}).to_excel(
+                writer, sheet_name="Second", index=False
+            )
+
+        results = ExcelParser().parse(file_path)
+
+        assert [r.page_number for r in results] == [1, 2]
+        assert results[0].content.text.splitlines()[-2:] == ["1", "2"]
+        assert results[1].content.headings[1].text == "B"
+
     def test_dataframe_to_content(self):
         """Test DataFrame to PageContent conversion."""
         parser = ExcelParser()
@@ -65,6 +83,20 @@ class TestExcelParser:
         assert len(content.headings) > 0
         assert content.headings[0].text == "Sheet: TestSheet"
 
+    def test_dataframe_to_content_missing_values(self):
+        """Test that missing cells render blank and empty rows are skipped."""
+        parser = ExcelParser()
+        df = pd.DataFrame({"Name": ["Alice", None, "Bob"], "Score": [1.5, None, None]})
+
+        content = parser._dataframe_to_content(df, "Scores")
+
+        assert content.text.splitlines()[-3:] == ["Alice | 1.5", " | ", "Bob | "]
+        assert content.paragraphs == [
+            "Headers: Name | Score",
+            "Alice | 1.5",
+            "Bob | ",
+        ]
+
     def test_dataframe_to_content_empty(self):
         """Test empty DataFrame conversion."""
         parser = ExcelParser()
@@ -141,6 +173,30 @@ class TestCSVParser:
         assert "Score:" in content.text
         assert "mean=" in content.text
 
+    def test_dataframe_to_content_keeps_column_types(self):
+        """Test sample rows format each value with its own column's type."""
+        parser = CSVParser()
+        df = pd.DataFrame({"Count": [1, 2], "Ratio": [0.5, None]})
+
+        content = parser._dataframe_to_content(df, "/path/to/ratios.csv")
+
+        assert "1 | 0.5" in content.text
+        assert "2 | " in content.text
+        assert "Count: 2" in content.paragraphs
+
+    def test_dataframe_to_content_caps_wide_output(self):
+        """Test that very wide CSVs produce a truncated, bounded preview."""
+        from document_parser.parsers.csv_parser import _TEXT_BUDGET_CHARS
+
+        parser = CSVParser()
+        df = pd.DataFrame({f"col{i}": ["x" * 50] * 30 for i in range(200)})
+
+        content = parser._dataframe_to_content(df, "/path/to/wide.csv")
+
+        assert content.text.endswith("... (truncated)")
+        assert len(content.text) < _TEXT_BUDGET_CHARS + 100
+        assert len(content.paragraphs) < 12
+
     def test_read_csv_with_fallback(self, temp_dir):
         """Test CSV reading with encoding fallback."""
         parser = CSVParser()
@@ -158,6 +214,58 @@ class TestCSVParser:
         assert "Name" in df.columns
         assert "Alice" in df["Name"].values
 
+    def test_read_csv_detects_separator_and_encoding(self, temp_dir):
+        """Test CSV reading detects a non-default separator and encoding."""
+        parser = CSVParser()
+
+        csv_content = "Name;City\nRené;Zürich\nBob;London"
+        csv_path = os.path.join(temp_dir, "latin1.csv")
+
+        with open(csv_path, "w", encoding="latin-1") as f:
+            f.write(csv_content)
+
+        df = parser._read_csv_with_fallback(csv_path)
+
+        assert list(df.columns) == ["Name", "City"]
+        assert df["City"].tolist() == ["Zürich", "London"]
+
+    def test_read_csv_with_utf16_bom(self, temp_dir):
+        """Test CSV reading picks the encoding from a byte order mark."""
+        parser = CSVParser()
+
+        csv_path = os.path.join(temp_dir, "utf16.csv")
+        with open(csv_path, "w", encoding="utf-16") as f:
+            f.write("Name;City\nRené;Zürich\n")
+
+        assert parser._detect_csv_format(csv_path) == ("utf-16", ";")
+        df = parser._read_csv_with_fallback(csv_path)
+        assert df["City"].tolist() == ["Zürich"]
+
+    def test_parse_large_file_in_chunks(self, temp_dir, monkeypatch):
+        """Test chunked parsing of large CSVs matches whole-file parsing."""
+        from document_parser.parsers import csv_parser
+
+        csv_path = os.path.join(temp_dir, "large.csv")
+        with open(csv_path, "w", encoding="utf-8") as f:
+            f.write("id,value,label\n")
+            for i in range(250):
+                value = "" if i % 40 == 0 else str((i * 37) % 101 - 50)
+                f.write(f"{i},{value},row{i}\n")
+
+        parser = CSVParser()
+        expected = parser.parse(csv_path)[0].content
+
+        monkeypatch.setattr(csv_parser, "_STREAM_THRESHOLD_BYTES", 0)
+        monkeypatch.setattr(csv_parser, "_STREAM_CHUNK_ROWS", 64)
+        with patch.object(
+            parser, "_dataframe_to_content", side_effect=AssertionError
+        ):
+            streamed = parser.parse(csv_path)[0].content
+
+        assert streamed.text == expected.text
+        assert streamed.paragraphs == expected.paragraphs
+        assert "Rows: 250" in streamed.text
+
     @patch("pandas.read_csv")
     def test_parse_corrupted_file(self, mock_read_csv):
         """Test parsing corrupted CSV file."""
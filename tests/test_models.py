@@ -3,10 +3,15 @@ Tests for data models.
 """
 
 import json
+import sys
 from datetime import datetime
 
+import pytest
+
 from document_parser.core.models import (
     HeadingInfo,
+    TableRow,
+    TableContent,
     PageContent,
     PageMetadata,
     PageResult,
@@ -24,6 +29,13 @@ class TestModels:
         assert heading.level == 1
         assert heading.text == "Chapter 1"
 
+    def test_heading_info_text_is_interned(self):
+        """Test that equal heading texts share one string object."""
+        first = HeadingInfo(level=1, text="".join(["Intro", "duction"]))
+        second = HeadingInfo(level=2, text="".join(["Introduc", "tion"]))
+
+        assert first.text is second.text
+
     def test_page_content(self):
         """Test PageContent model."""
         headings = [HeadingInfo(level=1, text="Title")]
@@ -40,6 +52,43 @@ class TestModels:
         assert data["text"] == "Some text"
         assert len(data["paragraphs"]) == 2
 
+    def test_page_content_with_tables_to_dict(self):
+        """Test PageContent serialization of headings and tables."""
+        table = TableContent(
+            rows=[
+                TableRow(cells=["Name", "Age"]),
+                TableRow(cells=["Alice", "25"]),
+            ]
+        )
+        content = PageContent(
+            text="Some text",
+            paragraphs=[],
+            headings=[HeadingInfo(level=2, text="Data")],
+            tables=[table],
+        )
+
+        data = content.to_dict()
+        assert data["headings"] == [{"level": 2, "text": "Data"}]
+        assert data["tables"] == [
+            {
+                "rows": [
+                    {"cells": ["Name", "Age"]},
+                    {"cells": ["Alice", "25"]},
+                ]
+            }
+        ]
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="slotted dataclasses need 3.10+"
+    )
+    def test_models_use_slots(self):
+        """Test that model instances do not carry a __dict__."""
+        heading = HeadingInfo(level=1, text="Title")
+        metadata = PageMetadata(word_count=1, char_count=4)
+
+        assert not hasattr(heading, "__dict__")
+        assert not hasattr(metadata, "__dict__")
+
     def test_page_metadata(self):
         """Test PageMetadata model."""
         metadata = PageMetadata(word_count=100, char_count=500)
@@ -145,6 +194,50 @@ class TestModels:
         assert isinstance(pretty_json, str)
         assert len(pretty_json) > len(json_str)  # Pretty should be longer
 
+    def test_document_result_json_matches_to_dict(self):
+        """Test that JSON output carries exactly the to_dict() structure."""
+        info = DocumentInfo(
+            filename="test.pdf",
+            file_type="pdf",
+            total_pages=1,
+            created_at=datetime.now(),
+            file_size=1000,
+        )
+        content = PageContent(
+            text="Test",
+            paragraphs=["Test"],
+            headings=[HeadingInfo(level=1, text="Title")],
+            tables=[TableContent(rows=[TableRow(cells=["a", "b"])])],
+        )
+        metadata = PageMetadata(word_count=1, char_count=4)
+        page = PageResult(page_number=1, content=content, metadata=metadata)
+        result = DocumentResult(document_info=info, pages=[page])
+
+        assert json.loads(result.to_json()) == result.to_dict()
+        assert json.loads(result.to_json(pretty=True)) == result.to_dict()
+
+    def test_document_result_json_without_orjson(self, monkeypatch):
+        """Test JSON serialization falls back to the stdlib encoder."""
+        from document_parser.core import models
+
+        info = DocumentInfo(
+            filename="résumé.pdf",
+            file_type="pdf",
+            total_pages=0,
+            created_at=datetime.now(),
+            file_size=1000,
+        )
+        result = DocumentResult(document_info=info, pages=[])
+        expected = result.to_json()
+        expected_pretty = result.to_json(pretty=True)
+
+        monkeypatch.setattr(models, "orjson", None)
+        fallback = result.to_json()
+
+        assert fallback == expected
+        assert result.to_json(pretty=True) == expected_pretty
+        assert "résumé.pdf" in fallback
+
     def test_document_result_save_to_file(self, temp_dir):
         """Test saving DocumentResult to file."""
         import os
@@ -175,3 +268,21 @@ class TestModels:
 
         assert "document_info" in data
         assert "pages" in data
+
+    def test_document_result_save_to_file_without_orjson(
+        self, temp_dir, monkeypatch, empty_document_result
+    ):
+        """Test saving DocumentResult to file with the stdlib encoder."""
+        import os
+
+        from document_parser.core import models
+
+        monkeypatch.setattr(models, "orjson", None)
+
+        output_path = os.path.join(temp_dir, "result.json")
+        empty_document_result.save_to_file(output_path)
+
+        with open(output_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        assert data == empty_document_result.to_dict()
@@ -4,11 +4,21 @@ Tests for the core DocumentParser class.
 
 import pytest
 import os
+from datetime import datetime
 from unittest.mock import Mock, patch
 
+from document_parser.core.models import (
+    DocumentInfo,
+    DocumentResult,
+    HeadingInfo,
+    PageContent,
+    PageMetadata,
+    PageResult,
+)
 from document_parser.core.parser import DocumentParser
 from document_parser.utils.exceptions import (
     UnsupportedFileTypeError,
+    InvalidConfigurationError,
     FileNotFoundError as CustomFileNotFoundError,
 )
 
@@ -22,12 +32,37 @@ class TestDocumentParser:
         assert parser is not None
         assert len(parser._parsers) == 4  # PDF, DOCX, Excel, and CSV parsers
 
+    def test_package_exports_real_class(self):
+        """Test that the package-level DocumentParser is the real class."""
+        from document_parser import DocumentParser as ExportedParser
+
+        assert ExportedParser is DocumentParser
+        assert type(ExportedParser()) is DocumentParser
+
     def test_init_with_config(self):
         """Test parser initialization with config."""
         config = {"some_option": "value"}
         parser = DocumentParser(config)
         assert parser.config == config
 
+    def test_pdf_processes_option(self):
+        """Test that the PDF page pool is only enabled through the config."""
+        assert DocumentParser()._get_parser("PDFParser").use_processes is False
+
+        parser = DocumentParser({"pdf_processes": True})
+        assert parser._get_parser("PDFParser").use_processes is True
+
+    def test_parsers_created_on_first_use(self):
+        """Test that parsers are only instantiated when a file needs them."""
+        parser = DocumentParser()
+
+        assert parser.supports_file("test.csv") is True
+        assert parser._parser_instances == {}
+
+        csv_parser = parser._get_parser_for_file("test.csv")
+        assert list(parser._parser_instances) == ["CSVParser"]
+        assert parser._get_parser_for_file("other.CSV") is csv_parser
+
     def test_supports_file_pdf(self):
         """Test file support detection for PDF."""
         parser = DocumentParser()
@@ -220,6 +255,42 @@ class TestDocumentParser:
             assert len(results) == 1
             assert results[0].document_info.filename == "success.pdf"
 
+    def test_batch_processing_preserves_order(self, temp_dir):
+        """Test that concurrent batch parsing returns results in input order."""
+        parser = DocumentParser({"max_workers": 4})
+
+        test_files = []
+        for i in range(8):
+            test_file = os.path.join(temp_dir, f"data{i}.csv")
+            with open(test_file, "w") as f:
+                f.write(f"id,value\n{i},{i * 10}\n")
+            test_files.append(test_file)
+
+        results = parser.parse_files(test_files)
+
+        assert [r.document_info.filename for r in results] == [
+            f"data{i}.csv" for i in range(8)
+        ]
+
+    def test_batch_processing_in_processes(self, temp_dir):
+        """Test that process-pool batch parsing keeps order and skips failures."""
+        parser = DocumentParser({"max_workers": 2, "parse_in_processes": True})
+
+        test_files = []
+        for i in range(5):
+            test_file = os.path.join(temp_dir, f"data{i}.csv")
+            with open(test_file, "w") as f:
+                f.write(f"id,value\n{i},{i * 10}\n")
+            test_files.append(test_file)
+        test_files.insert(2, os.path.join(temp_dir, "missing.csv"))
+
+        results = parser.parse_files(test_files)
+
+        assert [r.document_info.filename for r in results] == [
+            f"data{i}.csv" for i in range(5)
+        ]
+        assert "Rows: 1" in results[0].pages[0].content.text
+
     def test_batch_processing_empty_list(self):
         """Test batch processing with empty file list."""
         parser = DocumentParser()
@@ -261,3 +332,397 @@ class TestDocumentParser:
             error_call_args = mock_logger.error.call_args[0][0]
             assert "Failed to parse" in error_call_args
             assert "failing.pdf" in error_call_args
+
+    def test_render_template_reuses_compiled_template(self, empty_document_result):
+        """Test that repeated renders of the same template compile it once."""
+        from document_parser.utils.templates import _compile_template
+
+        parser = DocumentParser()
+        template = "{{ document.filename }}: {{ total_pages }} pages"
+
+        first = parser.render_template(template, empty_document_result)
+        hits_before = _compile_template.cache_info().hits
+        second = parser.render_template(template, empty_document_result)
+
+        assert first == second == "test.pdf: 0 pages"
+        assert _compile_template.cache_info().hits == hits_before + 1
+
+    def test_precompile_templates(self, temp_dir):
+        """Test that template files can be loaded when the parser is created."""
+        for name, source in [
+            ("good.j2", "{{ document.filename }}"),
+            ("broken.j2", "{% if %}"),
+            ("notes.txt", "not a template"),
+        ]:
+            with open(os.path.join(temp_dir, name), "w") as f:
+                f.write(source)
+
+        parser = DocumentParser({"template_dir": temp_dir})
+        processor = parser.get_template_processor()
+        env = processor._env
+
+        assert processor.precompile_templates() == 1
+        with patch.object(env, "get_template", wraps=env.get_template) as loader:
+            DocumentParser({"template_dir": temp_dir, "precompile_templates": True})
+        assert sorted(call.args[0] for call in loader.call_args_list) == [
+            "broken.j2",
+            "good.j2",
+        ]
+
+    def test_template_environment_shared_across_instances(self, temp_dir):
+        """Test that parsers with the same template dir share one environment."""
+        first = DocumentParser({"template_dir": temp_dir})
+        second = DocumentParser({"template_dir": temp_dir})
+
+        assert (
+            first.get_template_processor()._env
+            is second.get_template_processor()._env
+        )
+        assert first.get_template_processor() is second.get_template_processor()
+
+    def test_render_multiple_data_files_to_template(self, temp_dir):
+        """Test rendering several data files with one template file."""
+        with open(os.path.join(temp_dir, "rows.j2"), "w") as f:
+            f.write("{{ document.filename }}: {{ total_pages }}")
+        csv_paths = []
+        for name in ["a.csv", "b.csv"]:
+            csv_path = os.path.join(temp_dir, name)
+            with open(csv_path, "w") as f:
+                f.write("x,y\n1,2\n")
+            csv_paths.append(csv_path)
+        missing = os.path.join(temp_dir, "missing.csv")
+
+        parser = DocumentParser({"template_dir": temp_dir})
+        results = parser.render_multiple_data_files_to_template(
+            csv_paths + [missing], "rows.j2"
+        )
+
+        assert results["a.csv"] == "a.csv: 1"
+        assert results["b.csv"] == "b.csv: 1"
+        assert results["missing.csv"].startswith("Error:")
+
+    def test_render_multiple_data_files_in_worker_processes(self, temp_dir):
+        """Test that opted-in batches render in input order via worker processes."""
+        with open(os.path.join(temp_dir, "rows.j2"), "w") as f:
+            f.write("{{ document.filename }}")
+        csv_paths = []
+        for i in range(6):
+            csv_path = os.path.join(temp_dir, f"data{i}.csv")
+            with open(csv_path, "w") as f:
+                f.write(f"x,y\n{i},2\n")
+            csv_paths.append(csv_path)
+
+        parser = DocumentParser(
+            {"template_dir": temp_dir, "max_workers": 2, "parse_in_processes": True}
+        )
+        results = parser.render_multiple_data_files_to_template(csv_paths, "rows.j2")
+
+        assert list(results) == [f"data{i}.csv" for i in range(6)]
+        assert all(results[name] == name for name in results)
+
+    def test_render_data_file_to_multiple_templates(self, temp_dir):
+        """Test rendering one data file with several templates in processes."""
+        names = ["one", "two", "three", "four"]
+        for name in names:
+            with open(os.path.join(temp_dir, f"{name}.j2"), "w") as f:
+                f.write(name + ": {{ document.filename }} {{ run }}")
+        csv_path = os.path.join(temp_dir, "data.csv")
+        with open(csv_path, "w") as f:
+            f.write("x,y\n1,2\n")
+
+        parser = DocumentParser(
+            {
+                "template_dir": temp_dir,
+                "max_workers": 2,
+                "render_templates_in_processes": True,
+            }
+        )
+        results = parser.render_data_file_to_multiple_templates(
+            csv_path,
+            [f"{name}.j2" for name in names] + ["missing.j2"],
+            extra_context={"run": 7},
+        )
+
+        assert list(results) == names + ["missing"]
+        assert results["three"] == "three: data.csv 7"
+        assert results["missing"].startswith("Error:")
+
+    def test_render_data_file_to_multiple_templates_in_process(self, temp_dir):
+        """Test that template batches render in-process by default."""
+        names = ["one", "two", "three", "four"]
+        for name in names:
+            with open(os.path.join(temp_dir, f"{name}.j2"), "w") as f:
+                f.write(name + ": {{ document.filename }}")
+        csv_path = os.path.join(temp_dir, "data.csv")
+        with open(csv_path, "w") as f:
+            f.write("x,y\n1,2\n")
+
+        parser = DocumentParser({"template_dir": temp_dir})
+        with patch("document_parser.core.parser.ProcessPoolExecutor") as pool:
+            results = parser.render_data_file_to_multiple_templates(
+                csv_path, [f"{name}.j2" for name in names]
+            )
+
+        pool.assert_not_called()
+        assert results["four"] == "four: data.csv"
+
+    def test_render_multiple_data_files_missing_template(self, temp_dir):
+        """Test that a missing template is reported for every file."""
+        parser = DocumentParser({"template_dir": temp_dir})
+
+        results = parser.render_multiple_data_files_to_template(
+            ["a.csv", "b.csv"], "missing.j2"
+        )
+
+        assert set(results) == {"a.csv", "b.csv"}
+        assert results["a.csv"] == (
+            "Error: Error rendering data file 'a.csv' to template 'missing.j2': "
+            "Template file not found: missing.j2"
+        )
+        assert all("Template file not found" in r for r in results.values())
+
+    def test_render_multiple_builds_context_once(
+        self, temp_dir, empty_document_result
+    ):
+        """Test that render_multiple shares one context across templates."""
+        with open(os.path.join(temp_dir, "name.j2"), "w") as f:
+            f.write("{{ document.filename }}")
+        processor = DocumentParser({"template_dir": temp_dir}).get_template_processor()
+
+        with patch.object(
+            processor, "_build_context", wraps=processor._build_context
+        ) as build_context:
+            results = processor.render_multiple(
+                [
+                    {"name": "string", "string": "{{ total_words }} {{ tag }}"},
+                    {"name": "file", "file": "name.j2"},
+                    {"name": "missing", "file": "missing.j2"},
+                ],
+                empty_document_result,
+                extra_context={"tag": "x"},
+            )
+
+        assert results["string"] == "0 x"
+        assert results["file"] == "test.pdf"
+        assert "Template file not found" in results["missing"]
+        build_context.assert_called_once()
+
+    def test_get_template_does_not_reparse_source(
+        self, temp_dir, empty_document_result
+    ):
+        """Test that loading a file template leaves parsing to Jinja's loader."""
+        with open(os.path.join(temp_dir, "total.j2"), "w") as f:
+            f.write("{{ total_words }}")
+        processor = DocumentParser({"template_dir": temp_dir}).get_template_processor()
+
+        with patch.object(processor._env, "parse", wraps=processor._env.parse) as parse:
+            template = processor.get_template("total.j2")
+
+        parse.assert_not_called()
+        assert processor.render_compiled(template, empty_document_result) == "0"
+
+    def test_render_multiple_renders_repeated_source_once(self, empty_document_result):
+        """Test that entries sharing a template source are rendered once."""
+        processor = DocumentParser().get_template_processor()
+
+        with patch.object(
+            processor, "_render_string", wraps=processor._render_string
+        ) as render_string:
+            results = processor.render_multiple(
+                [
+                    {"name": "first", "string": "{{ document.filename }}"},
+                    {"name": "second", "string": "{{ document.filename }}"},
+                    {"name": "other", "string": "{{ total_pages }}"},
+                ],
+                empty_document_result,
+            )
+
+        assert results == {"first": "test.pdf", "second": "test.pdf", "other": "0"}
+        assert render_string.call_count == 2
+
+    def test_render_skips_unused_page_aggregates(self):
+        """Test that aggregates a template never reads are not built."""
+        info = DocumentInfo(
+            filename="test.pdf",
+            file_type="pdf",
+            total_pages=1,
+            created_at=datetime.now(),
+            file_size=1000,
+        )
+        page = PageResult(
+            page_number=1,
+            content=PageContent(
+                text="Hello world", paragraphs=["Hello world"], headings=[]
+            ),
+            metadata=PageMetadata(word_count=2, char_count=11),
+        )
+        result = DocumentResult(document_info=info, pages=[page])
+        parser = DocumentParser()
+
+        page_patch = patch.object(PageResult, "to_dict", wraps=page.to_dict)
+        info_patch = patch.object(DocumentInfo, "to_dict", wraps=info.to_dict)
+        with page_patch as to_dict, info_patch as info_to_dict:
+            rendered = parser.render_template("{{ total_words }} words", result)
+            assert rendered == "2 words"
+            to_dict.assert_not_called()
+            info_to_dict.assert_not_called()
+
+            rendered = parser.render_template("{{ pages_dict|length }}", result)
+            assert rendered == "1"
+            to_dict.assert_called_once()
+
+    def test_template_helpers_keep_document_order(self):
+        """Test heading and word count helpers against a multi-page document."""
+        info = DocumentInfo(
+            filename="test.pdf",
+            file_type="pdf",
+            total_pages=3,
+            created_at=datetime.now(),
+            file_size=1000,
+        )
+        pages = [
+            PageResult(
+                page_number=n,
+                content=PageContent(
+                    text="",
+                    paragraphs=[],
+                    headings=[HeadingInfo(level=n % 2 + 1, text=f"H{n}")],
+                ),
+                metadata=PageMetadata(word_count=words, char_count=0),
+            )
+            for n, words in [(1, 50), (2, 10), (3, 30)]
+        ]
+        result = DocumentResult(document_info=info, pages=pages)
+        template = (
+            "{% for h in get_headings_by_level(2) %}{{ h.text }} {% endfor %}|"
+            "{% for p in word_count_range(20, 50) %}{{ p.page_number }} {% endfor %}|"
+            "{{ get_headings_by_level(5)|length }}"
+            "{{ word_count_range(60, 100)|length }}"
+        )
+
+        rendered = DocumentParser().render_template(template, result)
+
+        assert rendered == "H1 H3 |1 3 |00"
+
+    def test_render_compiled_template_example(self, empty_document_result):
+        """Test rendering a precompiled template example."""
+        from document_parser.utils.templates import COMPILED_TEMPLATE_EXAMPLES
+
+        parser = DocumentParser()
+
+        rendered = parser.get_template_processor().render_compiled(
+            COMPILED_TEMPLATE_EXAMPLES["summary"], empty_document_result
+        )
+
+        assert "Filename: test.pdf" in rendered
+        assert "Type: PDF" in rendered
+
+    def test_render_example_by_name(self, empty_document_result):
+        """Test rendering a template example by name."""
+        processor = DocumentParser().get_template_processor()
+
+        rendered = processor.render_example("summary", empty_document_result)
+
+        assert "Filename: test.pdf" in rendered
+        with pytest.raises(InvalidConfigurationError):
+            processor.render_example("missing", empty_document_result)
+
+    def test_save_rendered_template_creates_directory(
+        self, temp_dir, empty_document_result
+    ):
+        """Test that saving creates directories and survives failed renders."""
+        processor = DocumentParser().get_template_processor()
+        output_path = os.path.join(temp_dir, "reports", "nested", "out.txt")
+
+        processor.save_rendered_template(
+            "{{ document.filename }}", empty_document_result, output_path
+        )
+        processor.save_rendered_template("again", empty_document_result, output_path)
+
+        with open(output_path, encoding="utf-8") as f:
+            assert f.read() == "again"
+
+        with pytest.raises(InvalidConfigurationError):
+            processor.save_rendered_template(
+                "{{ 1 / 0 }}", empty_document_result, output_path
+            )
+        with open(output_path, encoding="utf-8") as f:
+            assert f.read() == "again"
+        assert os.listdir(os.path.dirname(output_path)) == ["out.txt"]
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_save_rendered_template_applies_current_umask(
+        self, temp_dir, empty_document_result
+    ):
+        """Test that saved output gets the mode open() would give it."""
+        processor = DocumentParser().get_template_processor()
+        output_path = os.path.join(temp_dir, "out.txt")
+
+        old_umask = os.umask(0o027)
+        try:
+            processor.save_rendered_template("x", empty_document_result, output_path)
+        finally:
+            os.umask(old_umask)
+
+        assert os.stat(output_path).st_mode & 0o777 == 0o640
+
+    def test_render_many_compiles_once(self, temp_dir):
+        """Test that batch rendering compiles the template once for all documents."""
+        from document_parser.utils.templates import _compile_template
+
+        with open(os.path.join(temp_dir, "name.j2"), "w") as f:
+            f.write("{{ document.filename }}{{ tag }}")
+        processor = DocumentParser({"template_dir": temp_dir}).get_template_processor()
+        results = [
+            DocumentResult(
+                document_info=DocumentInfo(
+                    filename=f"doc{n}.pdf",
+                    file_type="pdf",
+                    total_pages=0,
+                    created_at=datetime.now(),
+                    file_size=1000,
+                ),
+                pages=[],
+            )
+            for n in range(3)
+        ]
+
+        calls_before = sum(_compile_template.cache_info()[:2])
+        rendered = processor.render_many("{{ document.filename }}", results)
+        assert sum(_compile_template.cache_info()[:2]) == calls_before + 1
+        assert rendered == ["doc0.pdf", "doc1.pdf", "doc2.pdf"]
+
+        rendered = processor.render_file_many("name.j2", results, {"tag": "!"})
+        assert rendered == ["doc0.pdf!", "doc1.pdf!", "doc2.pdf!"]
+
+    def test_render_structured_template_example(self):
+        """Test that structured examples decode to Python data."""
+        parser = DocumentParser()
+        info = DocumentInfo(
+            filename='say "hi" r\U0001F600.pdf',
+            file_type="pdf",
+            total_pages=1,
+            created_at=datetime.now(),
+            file_size=1000,
+        )
+        page = PageResult(
+            page_number=1,
+            content=PageContent(
+                text="",
+                paragraphs=[],
+                headings=[HeadingInfo(level=1, text="\U0001F4C8 <Growth>")],
+            ),
+            metadata=PageMetadata(word_count=0, char_count=0),
+        )
+        result = DocumentResult(document_info=info, pages=[page])
+        processor = parser.get_template_processor()
+
+        data = processor.render_example_data("json_summary", result)
+
+        assert data["summary"]["filename"] == 'say "hi" r\U0001F600.pdf'
+        assert data["summary"]["size_bytes"] == 1000
+        assert data["headings"] == [{"level": 1, "text": "\U0001F4C8 <Growth>"}]
+        # Decoded text must be encodable, i.e. free of lone surrogates
+        data["summary"]["filename"].encode("utf-8")
+        with pytest.raises(InvalidConfigurationError):
+            processor.render_example_data("summary", result)
@@ -24,6 +24,8 @@ class TestPDFParser:
         assert parser.supports_file_type("test.csv") is False
         assert parser.supports_file_type("test.xlsx") is False
 
+    @patch("document_parser.parsers.pdf_parser.pymupdf", None)
+    @patch("document_parser.parsers.pdf_parser._PDFTOTEXT", None)
     @patch("pdfplumber.open")
     def test_parse_success(self, mock_pdfplumber_open):
         """Test successful PDF parsing."""
@@ -57,6 +59,8 @@ class TestPDFParser:
         assert results[0].metadata.word_count > 0
         assert results[0].metadata.char_count > 0
 
+    @patch("document_parser.parsers.pdf_parser.pymupdf", None)
+    @patch("document_parser.parsers.pdf_parser._PDFTOTEXT", None)
     @patch("pdfplumber.open")
     # @pytest.mark.xfail(
     #     reason="PDF table parsing may not be fully supported or may change in future implementations"
@@ -90,6 +94,8 @@ class TestPDFParser:
         assert len(content.tables) == 1
         assert len(content.tables[0].rows) == 3
 
+    @patch("document_parser.parsers.pdf_parser.pymupdf", None)
+    @patch("document_parser.parsers.pdf_parser._PDFTOTEXT", None)
     @patch("pdfplumber.open")
     def test_parse_empty_pdf(self, mock_pdfplumber_open):
         """Test parsing empty PDF."""
@@ -109,6 +115,19 @@ class TestPDFParser:
         assert results[0].content.text == ""
         assert results[0].metadata.word_count == 0
 
+    def test_whitespace_only_page(self):
+        """Test that a page with only whitespace becomes an empty page."""
+        result = PDFParser()._build_page_result(3, " \n\n \t\n")
+
+        assert result.page_number == 3
+        assert result.content.text == ""
+        assert result.content.paragraphs == []
+        assert result.content.headings == []
+        assert result.metadata.word_count == 0
+        assert result.metadata.char_count == 0
+
+    @patch("document_parser.parsers.pdf_parser.pymupdf", None)
+    @patch("document_parser.parsers.pdf_parser._PDFTOTEXT", None)
     @patch("pdfplumber.open")
     def test_parse_corrupted_file(self, mock_pdfplumber_open):
         """Test parsing corrupted PDF file."""
@@ -121,6 +140,162 @@ class TestPDFParser:
         assert "Failed to parse PDF file" in str(exc_info.value)
         assert exc_info.value.filename == "corrupted.pdf"
 
+    @patch("document_parser.parsers.pdf_parser.pymupdf", None)
+    @patch("document_parser.parsers.pdf_parser._PDFTOTEXT", "/usr/bin/pdftotext")
+    @patch("subprocess.run")
+    def test_parse_with_pdftotext(self, mock_run):
+        """Test that pdftotext output is split into pages on form feeds."""
+        mock_run.return_value = Mock(
+            returncode=0,
+            stdout=b"CHAPTER ONE\n\nFirst page\n\fSecond page text\n\f",
+        )
+
+        results = PDFParser().parse("sample.pdf")
+
+        assert [r.page_number for r in results] == [1, 2]
+        assert results[0].content.paragraphs == ["CHAPTER ONE", "First page"]
+        assert results[0].content.headings[0].text == "CHAPTER ONE"
+        assert results[1].content.text == "Second page text"
+        assert results[1].metadata.word_count == 3
+
+    @patch("document_parser.parsers.pdf_parser.pymupdf", None)
+    @patch("document_parser.parsers.pdf_parser._PDFTOTEXT", "/usr/bin/pdftotext")
+    @patch("subprocess.run")
+    @patch("pdfplumber.open")
+    def test_pdftotext_failure_falls_back(self, mock_pdfplumber_open, mock_run):
+        """Test that a failing pdftotext run falls back to pdfplumber."""
+        mock_run.return_value = Mock(returncode=1, stdout=b"")
+        mock_page = Mock()
+        mock_page.extract_text.return_value = "Fallback text"
+        mock_pdf = Mock()
+        mock_pdf.pages = [mock_page]
+        mock_pdfplumber_open.return_value.__enter__.return_value = mock_pdf
+
+        results = PDFParser().parse("sample.pdf")
+
+        assert len(results) == 1
+        assert results[0].content.text == "Fallback text"
+
+    def test_parse_with_pymupdf(self, temp_dir):
+        """Test parsing a real PDF with the PyMuPDF backend."""
+        pymupdf = pytest.importorskip("pymupdf")
+
+        pdf_path = os.path.join(temp_dir, "two_pages.pdf")
+        doc = pymupdf.open()
+        for body in ["INTRODUCTION\nFirst page text", "Second page text"]:
+            doc.new_page().insert_text((72, 72), body)
+        doc.save(pdf_path)
+        doc.close()
+
+        results = PDFParser().parse(pdf_path)
+
+        assert [r.page_number for r in results] == [1, 2]
+        assert "First page text" in results[0].content.text
+        assert results[0].content.headings[0].text == "INTRODUCTION"
+        assert results[1].metadata.word_count == 3
+
+    @patch("document_parser.parsers.pdf_parser.pymupdf", None)
+    @patch("document_parser.parsers.pdf_parser._PDFTOTEXT", None)
+    def test_parse_long_pdf_in_worker_processes(self, temp_dir):
+        """Test that pages extracted in worker processes keep their order."""
+        fitz = pytest.importorskip("pymupdf")
+
+        pdf_path = os.path.join(temp_dir, "long.pdf")
+        doc = fitz.open()
+        for page_num in range(1, 21):
+            doc.new_page().insert_text((72, 72), f"Body of page {page_num}")
+        doc.save(pdf_path)
+        doc.close()
+
+        with patch("os.cpu_count", return_value=3):
+            results = PDFParser(use_processes=True).parse(pdf_path)
+
+        assert [r.page_number for r in results] == list(range(1, 21))
+        assert [r.content.text for r in results] == [
+            f"Body of page {n}" for n in range(1, 21)
+        ]
+
+    @patch("document_parser.parsers.pdf_parser.pymupdf", None)
+    @patch("document_parser.parsers.pdf_parser._PDFTOTEXT", None)
+    @patch("pdfplumber.open")
+    def test_long_pdf_parsed_in_process_by_default(self, mock_pdfplumber_open):
+        """Test that long PDFs only use worker processes when enabled."""
+        page = Mock()
+        page.extract_text.return_value = "Body"
+        mock_pdf = MagicMock()
+        mock_pdf.pages = [page] * 20
+        mock_pdfplumber_open.return_value.__enter__.return_value = mock_pdf
+
+        target = "document_parser.parsers.pdf_parser.ProcessPoolExecutor"
+        with patch(target) as pool:
+            results = PDFParser().parse("long.pdf")
+
+        pool.assert_not_called()
+        assert len(results) == 20
+
+    def test_no_worker_processes_from_threads(self):
+        """Test that page extraction never starts a pool off the main thread."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        target = "document_parser.parsers.pdf_parser.ProcessPoolExecutor"
+        with patch(target) as pool, ThreadPoolExecutor(max_workers=1) as executor:
+            result = executor.submit(
+                PDFParser(use_processes=True)._extract_pages_in_workers,
+                "long.pdf",
+                20,
+            ).result()
+
+        assert result is None
+        pool.assert_not_called()
+
+    def test_pymupdf_matches_pdfplumber(self, temp_dir):
+        """Test that the PyMuPDF and pdfplumber backends agree on plain text."""
+        fitz = pytest.importorskip("pymupdf")
+        pytest.importorskip("pdfplumber")
+
+        pdf_path = os.path.join(temp_dir, "parity.pdf")
+        doc = fitz.open()
+        for page_num in range(1, 3):
+            page = doc.new_page()
+            lines = [
+                f"Chapter {page_num} Overview",
+                "Body text on the first line",
+                "continued on a second line.",
+                "1. Numbered section",
+                "Closing sentence.",
+            ]
+            for i, line in enumerate(lines):
+                page.insert_text((72, 72 + 14 * i), line)
+        doc.save(pdf_path)
+        doc.close()
+
+        fast = PDFParser().parse(pdf_path)
+        with patch("document_parser.parsers.pdf_parser.pymupdf", None), patch(
+            "document_parser.parsers.pdf_parser._PDFTOTEXT", None
+        ):
+            fallback = PDFParser().parse(pdf_path)
+
+        assert [r.to_dict() for r in fast] == [r.to_dict() for r in fallback]
+
+    def test_parse_password_protected_with_pymupdf(self, temp_dir):
+        """Test that encrypted PDFs raise PasswordProtectedError."""
+        pymupdf = pytest.importorskip("pymupdf")
+        from document_parser.utils.exceptions import PasswordProtectedError
+
+        pdf_path = os.path.join(temp_dir, "locked.pdf")
+        doc = pymupdf.open()
+        doc.new_page().insert_text((72, 72), "Secret")
+        doc.save(
+            pdf_path,
+            encryption=pymupdf.PDF_ENCRYPT_AES_256,
+            owner_pw="owner",
+            user_pw="user",
+        )
+        doc.close()
+
+        with pytest.raises(PasswordProtectedError):
+            PDFParser().parse(pdf_path)
+
     # @pytest.mark.xfail(
     #     reason="Page content processing may change in future implementations"
     # )
@@ -305,6 +480,106 @@ class TestDOCXParser:
         assert headings[1].text == "Subtitle"
         assert headings[1].level == 2
 
+    def test_extract_headings_without_level(self):
+        """Test that heading styles without a trailing level default to 1."""
+        parser = DOCXParser()
+
+        paragraphs = []
+        for text, style_name in [
+            ("Plain", "Heading"),
+            ("Linked", "Heading 2 Char"),
+            ("Deep", "Heading 12"),
+        ]:
+            paragraph = Mock()
+            paragraph.text = text
+            paragraph.style.name = style_name
+            paragraphs.append(paragraph)
+
+        headings = parser._extract_headings_from_paragraphs(paragraphs)
+
+        assert [(h.text, h.level) for h in headings] == [
+            ("Plain", 1),
+            ("Linked", 1),
+            ("Deep", 12),
+        ]
+
+    def test_headings_assigned_to_their_own_page(self, temp_dir):
+        """Test that headings only attach to the page holding their paragraph."""
+        docx = pytest.importorskip("docx")
+
+        file_path = os.path.join(temp_dir, "headings.docx")
+        document = docx.Document()
+        document.add_heading("Intro", level=1)
+        document.add_paragraph(" ".join(["word"] * 599 + ["Results"]))
+        document.add_heading("Results", level=2)
+        document.add_paragraph("Closing text")
+        document.save(file_path)
+
+        results = DOCXParser().parse(file_path)
+
+        assert len(results) == 3
+        assert [h.text for h in results[0].content.headings] == ["Intro"]
+        assert results[1].content.headings == []
+        assert [(h.text, h.level) for h in results[2].content.headings] == [
+            ("Results", 2)
+        ]
+
+    def test_streaming_reader_matches_python_docx(self, temp_dir):
+        """Test that the streaming XML reader agrees with python-docx."""
+        docx = pytest.importorskip("docx")
+        from document_parser.parsers.docx_parser import _iter_docx_paragraphs
+
+        file_path = os.path.join(temp_dir, "mixed.docx")
+        document = docx.Document()
+        document.add_heading("Overview", level=1)
+        paragraph = document.add_paragraph("Tabbed\ttext")
+        paragraph.add_run("wrapped").add_break()
+        document.add_paragraph("Quoted", style="Quote")
+        document.add_table(rows=1, cols=2).cell(0, 0).text = "Table cell"
+        document.add_paragraph("")
+        document.save(file_path)
+
+        streamed = list(_iter_docx_paragraphs(file_path))
+        expected = list(
+            DOCXParser._iter_document_paragraphs(docx.Document(file_path))
+        )
+
+        assert streamed == expected
+        assert streamed[0] == ("Overview", "Heading 1", False)
+        assert all("Table cell" not in text for text, _, _ in streamed)
+
+    def test_streaming_reader_handles_missing_styles(self, temp_dir):
+        """Test that paragraphs without a usable pStyle get the default style."""
+        import zipfile
+
+        from document_parser.parsers.docx_parser import _iter_docx_paragraphs
+
+        w = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+        file_path = os.path.join(temp_dir, "bare.docx")
+        with zipfile.ZipFile(file_path, "w") as archive:
+            archive.writestr(
+                "_rels/.rels",
+                '<Relationships xmlns="http://schemas.openxmlformats.org/'
+                'package/2006/relationships"><Relationship Id="rId1" '
+                'Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+                'relationships/officeDocument" Target="word/document.xml"/>'
+                "</Relationships>",
+            )
+            archive.writestr(
+                "word/document.xml",
+                f"<w:document {w}><w:body>"
+                "<w:p><w:r><w:t>No properties</w:t></w:r></w:p>"
+                "<w:p><w:pPr/><w:r><w:t>No style</w:t></w:r></w:p>"
+                "<w:p><w:pPr><w:pStyle/></w:pPr><w:r><w:t>No ID</w:t></w:r></w:p>"
+                "</w:body></w:document>",
+            )
+
+        assert list(_iter_docx_paragraphs(file_path)) == [
+            ("No properties", "", False),
+            ("No style", "", False),
+            ("No ID", "", False),
+        ]
+
     def test_process_table(self):
         """Test table processing."""
         parser = DOCXParser()
@@ -330,8 +605,8 @@ class TestDOCXParser:
         table_content = parser._process_table(mock_table)
 
         assert len(table_content.rows) == 2
-        assert table_content.rows[0].cells[0].text == "Name"
-        assert table_content.rows[1].cells[0].text == "Alice"
+        assert table_content.rows[0].cells[0] == "Name"
+        assert table_content.rows[1].cells[0] == "Alice"
 
 
 class TestIntegration: